@@ -1,11 +1,16 @@
 """
 PostgreSQL checkpoint adapter for LangGraph Functional API.
 """
+import atexit
 import threading
-import time
 from typing import Optional, Dict, Any
 from langgraph.checkpoint.postgres import PostgresSaver
 from app.core.logging import get_logger
+from app.agents.config import (
+    CHECKPOINT_POOL_MIN_SIZE,
+    CHECKPOINT_POOL_MAX_SIZE,
+    CHECKPOINT_POOL_CONNECT_TIMEOUT,
+)
 
 logger = get_logger(__name__)
 
@@ -32,16 +37,19 @@ def build_db_url() -> str:
 
 def get_sync_checkpointer() -> Optional[PostgresSaver]:
     """
-    Get cached sync checkpointer with long-lived connection (lazy initialization).
+    Get cached sync checkpointer backed by a connection pool (lazy initialization).
 
-    Creates a PostgresSaver with a persistent connection for the lifetime of the process.
+    Creates a PostgresSaver over a psycopg ConnectionPool for the lifetime of the process.
+    Concurrent workflows check out separate connections, so checkpoint reads/writes
+    are not serialized through a single connection, and broken connections are
+    detected on checkout and replaced by the pool.
     Uses lazy initialization to avoid connecting at import time (database may not be ready).
-    Thread-safe singleton pattern ensures only one connection is created.
+    Thread-safe singleton pattern ensures only one pool is created.
 
     Returns None if database is not available (allows module to import).
 
     Returns:
-        PostgresSaver instance with persistent connection, or None if database unavailable
+        PostgresSaver instance backed by a connection pool, or None if database unavailable
     """
     global _sync_checkpointer
 
@@ -54,41 +62,36 @@ def get_sync_checkpointer() -> Optional[PostgresSaver]:
             return _sync_checkpointer
 
         try:
-            from psycopg import Connection
+            from psycopg_pool import ConnectionPool, PoolTimeout
 
             db_url = build_db_url()
-            # Create a long-lived connection with autocommit enabled
-            # This is the recommended approach for persistent checkpointers
-            # Retry connection with exponential backoff if database isn't ready
-            max_retries = 5
-            retry_delay = 1.0
-
-            conn = None
-            for attempt in range(max_retries):
-                try:
-                    conn = Connection.connect(
-                        db_url, autocommit=True, prepare_threshold=0, connect_timeout=2
-                    )
-                    break
-                except Exception as e:
-                    if attempt < max_retries - 1:
-                        logger.debug(
-                            f"Failed to connect to database (attempt {attempt + 1}/{max_retries}), retrying in {retry_delay}s: {e}"
-                        )
-                        time.sleep(retry_delay)
-                        retry_delay *= 2  # Exponential backoff
-                    else:
-                        # On final failure, log but don't raise - allows module to import
-                        logger.debug(
-                            f"Database not available at import time, checkpointer will be created lazily on first use: {e}"
-                        )
-                        return None
-
-            if conn is None:
+            # Pooled connections with autocommit enabled (required by PostgresSaver)
+            pool = ConnectionPool(
+                db_url,
+                min_size=CHECKPOINT_POOL_MIN_SIZE,
+                max_size=CHECKPOINT_POOL_MAX_SIZE,
+                kwargs={"autocommit": True, "prepare_threshold": 0, "connect_timeout": 2},
+                check=ConnectionPool.check_connection,
+                name="checkpointer",
+                open=False,
+            )
+            pool.open()
+
+            # Wait for the first connection if the database isn't ready yet. The pool
+            # keeps retrying the connection in the background with its own backoff;
+            # wait() closes the pool on timeout, so it is called exactly once with
+            # the whole connect budget.
+            try:
+                pool.wait(timeout=CHECKPOINT_POOL_CONNECT_TIMEOUT)
+            except PoolTimeout as e:
+                # Don't raise - allows module to import
+                logger.debug(
+                    f"Database not available at import time, checkpointer will be created lazily on first use: {e}"
+                )
                 return None
 
-            # Create PostgresSaver with the connection
-            checkpointer = PostgresSaver(conn)
+            # Create PostgresSaver over the pool
+            checkpointer = PostgresSaver(pool)
 
             # Initialize database tables (required by LangGraph)
             # This is safe to call multiple times - it only creates tables if they don't exist
@@ -101,7 +104,10 @@ def get_sync_checkpointer() -> Optional[PostgresSaver]:
                     f"Checkpointer setup warning (tables may already exist): {e}"
                 )
 
-            logger.info("Checkpointer created successfully")
+            atexit.register(pool.close)
+            logger.info(
+                f"Checkpointer created successfully (pool size {CHECKPOINT_POOL_MIN_SIZE}-{CHECKPOINT_POOL_MAX_SIZE})"
+            )
             _sync_checkpointer = checkpointer
             return checkpointer
         except Exception as e:
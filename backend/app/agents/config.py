@@ -15,6 +15,12 @@ DEFAULT_MODEL = "gpt-4o-mini"
 # DEPRECATED: Keep for backward compatibility, but model selection should come from chat UI
 OPENAI_MODEL = DEFAULT_MODEL
 
+# Planner cascade: planning is a small classification + extraction task, so it
+# runs on this model first and escalates to the user-selected model on failure
+PLANNER_CHEAP_MODEL = "gpt-4o-mini"
+# Plan JSON is short (typically <400 tokens); the cap bounds worst-case decode time
+PLANNER_MAX_TOKENS = 600
+
 
 # LangSmith Configuration (optional, kept for compatibility)
 LANGCHAIN_API_KEY = os.getenv("LANGCHAIN_API_KEY")
@@ -33,6 +39,12 @@ from app.core.config import (
 # Checkpoint Configuration
 CHECKPOINT_TABLE_NAME = "checkpoints"
 CHECKPOINT_SCHEMA = "public"
+# Checkpoint connection pool: concurrent workflows each check out their own
+# connection instead of serializing checkpoint I/O through one connection
+CHECKPOINT_POOL_MIN_SIZE = int(os.getenv("CHECKPOINT_POOL_MIN_SIZE", "1"))
+CHECKPOINT_POOL_MAX_SIZE = int(os.getenv("CHECKPOINT_POOL_MAX_SIZE", "10"))
+# Seconds to wait for the pool's first connection before giving up (retried lazily on next use)
+CHECKPOINT_POOL_CONNECT_TIMEOUT = float(os.getenv("CHECKPOINT_POOL_CONNECT_TIMEOUT", "30"))
 
 # Agent Configuration
 MAX_ITERATIONS = 50  # Maximum graph iterations
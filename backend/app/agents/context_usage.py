@@ -6,13 +6,34 @@ of the model's context window, and trim messages using LangChain's built-in util
 """
 from typing import Dict, Any, List, Optional
 from langchain_core.messages import BaseMessage, trim_messages, SystemMessage
-from langchain_openai import ChatOpenAI
+from functools import partial
 from app.agents.config import get_model_context_window, DEFAULT_MODEL
-from app.rag.chunking.tokenizer import count_tokens
+from app.rag.chunking.tokenizer import count_tokens_batch
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Approximate per-message framing overhead (role, separators) in chat formats
+_TOKENS_PER_MESSAGE = 3
+
+
+def _count_message_tokens(messages: List[BaseMessage], model_name: str) -> int:
+    """
+    Count tokens in messages with the cached tiktoken encoding.
+
+    Used as the trim_messages token counter so trimming does not construct
+    a ChatOpenAI client per call just to reach its tokenizer.
+
+    Args:
+        messages: Messages to count
+        model_name: Model name for tokenizer selection
+
+    Returns:
+        Total tokens including per-message overhead
+    """
+    texts = [str(message.content) for message in messages if getattr(message, 'content', None)]
+    return count_tokens_batch(texts, model_name) + _TOKENS_PER_MESSAGE * len(messages)
+
 
 def calculate_context_usage(
     messages: List[BaseMessage],
@@ -38,13 +59,13 @@ def calculate_context_usage(
         # Get model's context window size
         context_window = get_model_context_window(model_name)
 
-        # Count tokens in all messages
-        total_tokens = 0
-        for message in messages:
-            if hasattr(message, 'content') and message.content:
-                content = str(message.content)
-                tokens = count_tokens(content, model_name)
-                total_tokens += tokens
+        # Count tokens in all messages (single batched tokenizer call)
+        texts = [
+            str(message.content)
+            for message in messages
+            if getattr(message, 'content', None)
+        ]
+        total_tokens = count_tokens_batch(texts, model_name)
 
         # Calculate percentage and remaining
         usage_percentage = (total_tokens / context_window) * 100 if context_window > 0 else 0
@@ -130,14 +151,11 @@ def get_trimmed_messages(
         if max_tokens is None:
             max_tokens = int(context_window * 0.8)
         
-        # Create token counter using the model's tokenizer
-        llm = ChatOpenAI(model=model_name)
-        
         # Use LangChain's trim_messages utility
         trimmed = trim_messages(
             messages,
             max_tokens=max_tokens,
-            token_counter=llm,  # Uses model's tokenizer
+            token_counter=partial(_count_message_tokens, model_name=model_name),
             strategy=strategy,  # "last" keeps most recent messages
             include_system=include_system,
             allow_partial=False,
@@ -5,56 +5,69 @@ This module implements the main agent workflow using LangGraph's StateGraph API,
 with support for tool execution, HITL approval, and streaming events.
 
 All data models use Pydantic for validation and type safety.
+
+Exports are resolved lazily (PEP 562) so importing a light submodule such as
+``app.agents.graph.models`` doesn't pull in the workflow, LLM clients and
+RAG pipeline through this package's __init__.
 """
 
-from .workflow import get_workflow, run_workflow, create_workflow, stategraph_workflow_events
-from .state import (
-    AgentState,
-    Task,
-    TaskDict,
-    create_task,
-    create_initial_state,
-    validate_task,
-    validate_tasks,
-    validate_approval_payload,
-    validate_player_data,
-    validate_workflow_input,
-)
-from .models import (
+from importlib import import_module
+from typing import Any
+
+# Public name -> (submodule, attribute)
+_LAZY_IMPORTS = {
+    # Workflow
+    "get_workflow": (".workflow", "get_workflow"),
+    "run_workflow": (".workflow", "run_workflow"),
+    "create_workflow": (".workflow", "create_workflow"),
+    "stategraph_workflow_events": (".workflow", "stategraph_workflow_events"),
+    # State
+    "AgentState": (".state", "AgentState"),
+    "Task": (".state", "Task"),
+    "TaskDict": (".state", "TaskDict"),
+    # State helpers
+    "create_task": (".state", "create_task"),
+    "create_initial_state": (".state", "create_initial_state"),
+    "validate_task": (".state", "validate_task"),
+    "validate_tasks": (".state", "validate_tasks"),
+    "validate_approval_payload": (".state", "validate_approval_payload"),
+    "validate_player_data": (".state", "validate_player_data"),
+    "validate_workflow_input": (".state", "validate_workflow_input"),
     # Enums
-    TaskStatus,
-    ApprovalType,
-    EventType,
-    # Request/Response
-    AgentRequest,
-    AgentResponse,
-    WorkflowInput,
-    ResumePayload,
+    "TaskStatus": (".models", "TaskStatus"),
+    "ApprovalType": (".models", "ApprovalType"),
+    "EventType": (".models", "EventType"),
+    # Request/Response models
+    "AgentRequest": (".models", "AgentRequest"),
+    "AgentResponse": (".models", "AgentResponse"),
+    "WorkflowInput": (".models", "WorkflowInput"),
+    "ResumePayload": (".models", "ResumePayload"),
     # Task models
-    Task as TaskModel,
-    TaskList,
+    "TaskModel": (".models", "Task"),
+    "TaskList": (".models", "TaskList"),
     # Tool models
-    SearchDocumentsInput,
-    SearchDocumentsOutput,
-    SavePlayerReportInput,
-    SavePlayerReportOutput,
+    "SearchDocumentsInput": (".models", "SearchDocumentsInput"),
+    "SearchDocumentsOutput": (".models", "SearchDocumentsOutput"),
+    "SavePlayerReportInput": (".models", "SavePlayerReportInput"),
+    "SavePlayerReportOutput": (".models", "SavePlayerReportOutput"),
     # Player models
-    PlayerData,
+    "PlayerData": (".models", "PlayerData"),
     # Approval models
-    ApprovalPayload,
+    "ApprovalPayload": (".models", "ApprovalPayload"),
     # Event models
-    TokenEvent,
-    TasksUpdatedEvent,
-    ToolStartEvent,
-    ToolCompleteEvent,
-    InterruptEvent,
-    UpdateEvent,
-    FinalEvent,
-    ErrorEvent,
-    DoneEvent,
-    MessageSavedEvent,
-)
-from .streaming import EventCallbackHandler
+    "TokenEvent": (".models", "TokenEvent"),
+    "TasksUpdatedEvent": (".models", "TasksUpdatedEvent"),
+    "ToolStartEvent": (".models", "ToolStartEvent"),
+    "ToolCompleteEvent": (".models", "ToolCompleteEvent"),
+    "InterruptEvent": (".models", "InterruptEvent"),
+    "UpdateEvent": (".models", "UpdateEvent"),
+    "FinalEvent": (".models", "FinalEvent"),
+    "ErrorEvent": (".models", "ErrorEvent"),
+    "DoneEvent": (".models", "DoneEvent"),
+    "MessageSavedEvent": (".models", "MessageSavedEvent"),
+    # Streaming
+    "EventCallbackHandler": (".streaming", "EventCallbackHandler"),
+}
 
 __all__ = [
     # Workflow
@@ -109,3 +122,19 @@ __all__ = [
     # Streaming
     "EventCallbackHandler",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported names on first access and cache them in the module."""
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,68 @@
+"""
+Lock-free event queue between the workflow thread and the SSE generator.
+
+Graph nodes and callback handlers push events from the workflow thread while
+stategraph_workflow_events polls them from the event loop. queue.Queue takes a
+mutex and notifies a condition variable on every put and get, which is pure
+overhead here: the consumer never blocks (it polls with get_nowait and sleeps
+on Empty), and deque.append / deque.popleft are already atomic in CPython.
+"""
+
+from collections import deque
+from queue import Empty, Full
+from typing import Any, Deque
+
+
+class EventQueue:
+    """
+    Bounded FIFO exposing the non-blocking subset of queue.Queue.
+
+    Safe for any number of producer threads and a single consumer. The size
+    bound is checked without a lock, so under concurrent puts it may be
+    exceeded by at most the number of producers - it only guards memory.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        """
+        Initialize the queue.
+
+        Args:
+            maxsize: Maximum number of queued events (0 = unbounded)
+        """
+        self.maxsize = maxsize
+        self._items: Deque[Any] = deque()
+
+    def put_nowait(self, item: Any) -> None:
+        """
+        Enqueue an event without blocking.
+
+        Raises:
+            Full: If the queue already holds maxsize events
+        """
+        if self.full():
+            raise Full
+        self._items.append(item)
+
+    def get_nowait(self) -> Any:
+        """
+        Dequeue the oldest event without blocking.
+
+        Raises:
+            Empty: If no event is queued
+        """
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise Empty from None
+
+    def qsize(self) -> int:
+        """Return the approximate number of queued events."""
+        return len(self._items)
+
+    def full(self) -> bool:
+        """Return True if the queue holds maxsize events."""
+        return self.maxsize > 0 and len(self._items) >= self.maxsize
+
+    def empty(self) -> bool:
+        """Return True if no event is queued."""
+        return not self._items
@@ -2,7 +2,8 @@
 Event emission utilities for the StateGraph workflow.
 
 Provides functions to emit typed events to the SSE stream.
-Uses Pydantic models for event validation where appropriate.
+Payloads are plain dicts; the event models in .models describe their shape
+for API consumers and are not instantiated per emit.
 """
 
 from typing import Optional, Dict, Any, List
@@ -10,18 +11,13 @@ from queue import Queue, Full
 from pydantic import ValidationError
 from langchain_core.runnables import RunnableConfig
 from app.core.logging import get_logger
-from .models import (
-    TasksUpdatedEvent,
-    ToolStartEvent,
-    ToolCompleteEvent,
-    InterruptEvent,
-    TokenEvent,
-    Task as TaskModel,
-    TaskStatus,
-)
+from .models import Task as TaskModel, TaskStatus
 
 logger = get_logger(__name__)
 
+# Status values accepted by TaskModel (use_enum_values stores the plain string)
+_TASK_STATUSES = frozenset(status.value for status in TaskStatus)
+
 
 def get_event_queue(config: Optional[RunnableConfig]) -> Optional[Queue]:
     """Extract event queue from config."""
@@ -47,6 +43,27 @@ def emit_event(
     if not queue:
         return
 
+    _put_event(queue, event_type, data)
+
+
+def _put_event(queue: Queue, event_type: str, data: Dict[str, Any]) -> None:
+    """
+    Put an event envelope on an already-resolved event queue.
+
+    The public emit_* helpers resolve the queue first and return before
+    building their payload when there is no consumer (non-streaming runs).
+
+    Args:
+        queue: Event queue from get_event_queue
+        event_type: Type of event (token, tasks_updated, etc.)
+        data: Event payload data
+    """
+    # Check before putting: when the consumer falls behind, every emit would
+    # otherwise raise and catch Full. The except below only covers the race
+    # with another producer filling the last slot.
+    if queue.full():
+        logger.debug(f"[EVENT] Queue full, dropped {event_type}")
+        return
     try:
         queue.put_nowait({
             "type": event_type,
@@ -65,14 +82,37 @@ def emit_tasks_updated(config: RunnableConfig, tasks: List[Dict[str, Any]]) -> N
         config: RunnableConfig containing event_queue
         tasks: List of task dictionaries
     """
+    queue = get_event_queue(config)
+    if not queue:
+        return
+
     # Validate each task before emitting
     validated_tasks = []
     for t in tasks:
+        task_id = t.get("id", "")
+        description = t.get("description", "")
+        status = t.get("status", "pending")
+        # Fast path: tasks built by graph nodes already satisfy TaskModel's
+        # constraints, so skip constructing a model just to read fields back
+        if (
+            isinstance(task_id, str)
+            and isinstance(description, str)
+            and description
+            and status in _TASK_STATUSES
+        ):
+            validated_tasks.append({
+                "id": task_id,
+                "description": description,
+                "status": status,
+            })
+            continue
         try:
+            # Pass the raw status: the model coerces it to TaskStatus, and an
+            # unknown value surfaces as ValidationError instead of ValueError
             validated = TaskModel(
-                id=t.get("id", ""),
-                description=t.get("description", ""),
-                status=TaskStatus(t.get("status", "pending")),
+                id=task_id,
+                description=description,
+                status=status,
                 result=t.get("result"),
             )
             validated_tasks.append({
@@ -88,7 +128,7 @@ def emit_tasks_updated(config: RunnableConfig, tasks: List[Dict[str, Any]]) -> N
                 "status": t.get("status", "pending"),
             })
 
-    emit_event(config, "tasks_updated", {"tasks": validated_tasks})
+    _put_event(queue, "tasks_updated", {"tasks": validated_tasks})
 
 
 def emit_tool_start(config: RunnableConfig, tool_name: str, args: Dict[str, Any]) -> None:
@@ -104,7 +144,11 @@ def emit_tool_start(config: RunnableConfig, tool_name: str, args: Dict[str, Any]
         logger.warning("[EVENT] emit_tool_start called with empty tool_name")
         return
 
-    emit_event(config, "tool_start", {
+    queue = get_event_queue(config)
+    if not queue:
+        return
+
+    _put_event(queue, "tool_start", {
         "tool": tool_name,
         "description": f"Running {tool_name}...",
     })
@@ -123,7 +167,11 @@ def emit_tool_complete(config: RunnableConfig, tool_name: str, success: bool) ->
         logger.warning("[EVENT] emit_tool_complete called with empty tool_name")
         return
 
-    emit_event(config, "tool_complete", {
+    queue = get_event_queue(config)
+    if not queue:
+        return
+
+    _put_event(queue, "tool_complete", {
         "tool": tool_name,
         "success": success,
     })
@@ -146,6 +194,10 @@ def emit_approval_required(
         logger.warning("[EVENT] emit_approval_required called with empty approval_type")
         return
 
+    queue = get_event_queue(config)
+    if not queue:
+        return
+
     if not payload:
         logger.warning("[EVENT] emit_approval_required called with empty payload")
         payload = {}
@@ -156,7 +208,7 @@ def emit_approval_required(
         **payload,
     }
 
-    emit_event(config, "interrupt", event_data)
+    _put_event(queue, "interrupt", event_data)
 
 
 def emit_token(config: RunnableConfig, token: str) -> None:
@@ -170,7 +222,15 @@ def emit_token(config: RunnableConfig, token: str) -> None:
     if not token:
         return  # Don't emit empty tokens
 
-    emit_event(config, "token", {"value": token})
+    # Hottest event (one per streamed token): enqueue directly without the
+    # per-event debug log in emit_event
+    queue = get_event_queue(config)
+    if not queue or queue.full():
+        return
+    try:
+        queue.put_nowait({"type": "token", "data": {"value": token}})
+    except Full:
+        logger.debug("[EVENT] Queue full, dropped token")
 
 
 def emit_error(config: RunnableConfig, error: str) -> None:
@@ -181,10 +241,14 @@ def emit_error(config: RunnableConfig, error: str) -> None:
         config: RunnableConfig containing event_queue
         error: Error message
     """
+    queue = get_event_queue(config)
+    if not queue:
+        return
+
     if not error:
         error = "Unknown error occurred"
 
-    emit_event(config, "error", {"error": error})
+    _put_event(queue, "error", {"error": error})
 
 
 def emit_plan_proposal(
@@ -216,6 +280,10 @@ def emit_plan_proposal(
         logger.warning("[EVENT] emit_plan_proposal called with empty plan")
         return
 
+    queue = get_event_queue(config)
+    if not queue:
+        return
+
     # Structure the plan data as PlanPanel expects it
     # PlanPanel accesses plan.plan for the steps array
     plan_data = {
@@ -228,7 +296,7 @@ def emit_plan_proposal(
         "session_id": session_id,
     }
 
-    emit_event(config, "update", {
+    _put_event(queue, "update", {
         "type": "plan_proposal",
         "plan": plan_data,  # Nested structure so frontend can access plan.plan
     })
@@ -256,7 +324,11 @@ def emit_status(
     if not task or not status:
         return
 
-    emit_event(config, "update", {
+    queue = get_event_queue(config)
+    if not queue:
+        return
+
+    _put_event(queue, "update", {
         "task": task,
         "status": status,
         "is_completed": is_completed,
@@ -282,7 +354,7 @@ def emit_plan_step_progress(
         config: RunnableConfig containing event_queue
         step_index: Current step index (0-based)
         total_steps: Total number of steps in the plan
-        status: Step status ('pending', 'in_progress', 'completed', 'error')
+        status: Step status ('pending', 'in_progress', 'completed', 'error', 'skipped')
         step_name: Display name for the step
         result: Optional result text for completed steps
     """
@@ -290,7 +362,11 @@ def emit_plan_step_progress(
         logger.debug(f"[EVENT] Skipping plan_step_progress with total_steps={total_steps}")
         return
 
-    emit_event(config, "plan_step_progress", {
+    queue = get_event_queue(config)
+    if not queue:
+        return
+
+    _put_event(queue, "plan_step_progress", {
         "type": "plan_step_progress",
         "step_index": step_index,
         "total_steps": total_steps,
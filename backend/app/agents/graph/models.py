@@ -171,6 +171,84 @@ class PlayerData(BaseModel):
         return v.strip()
 
 
+# =============================================================================
+# Structured LLM Output Models (bound via with_structured_output)
+# =============================================================================
+# All fields are required (nullable where data may be missing) so the schemas
+# are valid for OpenAI strict structured outputs.
+
+class PlanStepDraft(BaseModel):
+    """A single step proposed by the planner LLM."""
+
+    action: Literal["search", "synthesize"] = Field(
+        ..., description="'search' to query documents, 'synthesize' to compile the report"
+    )
+    description: str = Field(..., description="What this step does, shown to the user")
+    query: Optional[str] = Field(
+        ..., description="Specific, targeted search query; null for synthesize steps"
+    )
+
+
+class PlannerOutput(BaseModel):
+    """Planner LLM output: request classification and execution plan."""
+
+    player_name: Optional[str] = Field(..., description="Extracted player name, or null")
+    sport_guess: Optional[str] = Field(
+        ..., description="Guessed sport (football, basketball, etc.), or null"
+    )
+    is_scouting_request: bool = Field(..., description="Whether the user wants a scouting report")
+    plan: List[PlanStepDraft] = Field(
+        ..., description="Execution steps; empty for simple questions"
+    )
+
+
+class PhysicalProfile(BaseModel):
+    """Physical measurements extracted from documents."""
+
+    height_cm: Optional[float] = Field(..., description="Height in centimetres, or null")
+    weight_kg: Optional[float] = Field(..., description="Weight in kilograms, or null")
+
+
+class PlayerProfile(BaseModel):
+    """Player profile extracted by the composer LLM."""
+
+    display_name: str = Field(..., description="Full player name")
+    sport: Optional[str] = Field(..., description="football, basketball or nba")
+    positions: List[str] = Field(..., description="Playing positions")
+    teams: List[str] = Field(..., description="Current team(s)")
+    league: Optional[str] = Field(..., description="League name if known")
+    physical: PhysicalProfile
+
+
+class ScoutingAssessment(BaseModel):
+    """Scouting assessment extracted by the composer LLM."""
+
+    strengths: List[str] = Field(..., description="Key strengths")
+    weaknesses: List[str] = Field(..., description="Key weaknesses")
+    style_tags: List[str] = Field(..., description="Short playing-style tags")
+    role_projection: Optional[str] = Field(
+        ..., description="Brief description of the player's potential role"
+    )
+
+
+class ScoutingReportDraft(BaseModel):
+    """Composer LLM output: structured player data plus report narrative."""
+
+    player_profile: PlayerProfile
+    scouting_assessment: ScoutingAssessment
+    report_summary: List[str] = Field(
+        ..., description="3 key findings, each a complete sentence"
+    )
+    report_text: str = Field(
+        ...,
+        description=(
+            "Comprehensive 3-5 paragraph professional scouting narrative covering: "
+            "overview and background, technical abilities and playing style, physical "
+            "attributes, areas for improvement, overall assessment and potential"
+        ),
+    )
+
+
 # =============================================================================
 # Approval Payload Models
 # =============================================================================
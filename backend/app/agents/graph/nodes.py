@@ -5,17 +5,30 @@ Each node is a function that takes state and config, and returns state updates.
 Nodes use Pydantic models from models.py for validation where appropriate.
 """
 
-from typing import Dict, Any, Optional
+import hashlib
+import time
+from typing import Dict, Any, List, Optional, NamedTuple, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
+from functools import lru_cache
 from pydantic import ValidationError
 from langchain_openai import ChatOpenAI
+from openai import ContentFilterFinishReasonError, LengthFinishReasonError
+from langchain_core.exceptions import OutputParserException
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, ToolMessage
-from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables import Runnable, RunnableConfig
 from langgraph.types import interrupt
 
 from .state import AgentState, TaskDict
-from .tools import TOOLS, TOOL_EXECUTORS
-from .prompts import AGENT_SYSTEM_PROMPT
+from .tools import TOOLS, TOOL_EXECUTORS, retrieve_search_documents
+from .plan_templates import (
+    NO_PLAN_INTENTS,
+    SCOUTING_INTENT,
+    classify_intent,
+    match_template_request,
+    plan_templates,
+)
+from .prompts import AGENT_SYSTEM_PROMPT, PLANNER_SYSTEM_PROMPT, COMPOSER_SYSTEM_PROMPT
 from .events import (
     emit_tasks_updated,
     emit_tool_start,
@@ -28,14 +41,129 @@ from .events import (
 from .models import (
     ApprovalPayload,
     ApprovalType,
+    PlannerOutput,
+    ScoutingReportDraft,
     SearchDocumentsInput,
     SavePlayerReportInput,
 )
 from app.agents.graph.streaming import EventCallbackHandler
 from app.core.logging import get_logger
+from app.observability.tracing import (
+    get_callback_handler_for_user,
+    get_langfuse_client_for_user,
+    get_langfuse_metadata,
+)
+from app.core.llm_cache import llm_cache
+from app.core.http import get_openai_http_client
+from app.rag.chunking.tokenizer import fit_to_token_budget
+from app.settings import COMPOSER_MAX_CONTEXT_TOKENS
+from app.agents.config import PLANNER_CHEAP_MODEL, PLANNER_MAX_TOKENS
 
 logger = get_logger(__name__)
 
+# Static system messages, built once and reused across invocations
+_AGENT_SYSTEM_MSG = SystemMessage(content=AGENT_SYSTEM_PROMPT)
+_PLANNER_SYSTEM_MSG = SystemMessage(content=PLANNER_SYSTEM_PROMPT)
+_COMPOSER_SYSTEM_MSG = SystemMessage(content=COMPOSER_SYSTEM_PROMPT)
+
+
+# =============================================================================
+# LLM Client Cache
+# =============================================================================
+
+@lru_cache(maxsize=32)
+def _get_llm(
+    model: str,
+    api_key: str,
+    temperature: float,
+    streaming: bool = False,
+    max_tokens: Optional[int] = None,
+) -> ChatOpenAI:
+    """
+    Get a cached ChatOpenAI client for the given settings.
+
+    Reusing the client keeps its HTTP connection pool warm across requests,
+    and all clients share one process-wide HTTP/2 connection pool.
+    Per-request callbacks (event streaming, Langfuse) must be passed in the
+    invoke config, never the constructor, since the client is shared.
+
+    Args:
+        model: Model name
+        api_key: OpenAI API key
+        temperature: Sampling temperature
+        streaming: Whether to stream tokens
+        max_tokens: Optional response token limit
+
+    Returns:
+        Shared ChatOpenAI instance
+    """
+    llm_kwargs = {
+        "model": model,
+        "api_key": api_key,
+        "temperature": temperature,
+        "streaming": streaming,
+        "http_client": get_openai_http_client(),
+    }
+    if max_tokens is not None:
+        llm_kwargs["max_tokens"] = max_tokens
+    return ChatOpenAI(**llm_kwargs)
+
+
+@lru_cache(maxsize=32)
+def _get_structured_llm(
+    model: str,
+    api_key: str,
+    temperature: float,
+    schema: type,
+    max_tokens: Optional[int] = None,
+) -> Runnable:
+    """
+    Get a cached structured-output runnable over the shared client.
+
+    Args:
+        model: Model name
+        api_key: OpenAI API key
+        temperature: Sampling temperature
+        schema: Pydantic model the response is parsed into
+        max_tokens: Optional response token limit
+
+    Returns:
+        Runnable returning validated schema instances
+    """
+    return _get_llm(model, api_key, temperature, max_tokens=max_tokens).with_structured_output(
+        schema, method="json_schema", strict=True
+    )
+
+
+@lru_cache(maxsize=32)
+def _get_tool_llm(
+    model: str,
+    api_key: str,
+    temperature: float,
+    streaming: bool = False,
+    max_tokens: Optional[int] = None,
+) -> Runnable:
+    """
+    Get a cached tool-calling runnable over the shared client.
+
+    bind_tools converts every tool's args schema to an OpenAI function
+    definition; caching the bound runnable does that once per client
+    instead of on every agent step.
+
+    Args:
+        model: Model name
+        api_key: OpenAI API key
+        temperature: Sampling temperature
+        streaming: Whether to stream tokens
+        max_tokens: Optional response token limit
+
+    Returns:
+        Runnable with TOOLS bound
+    """
+    return _get_llm(
+        model, api_key, temperature, streaming=streaming, max_tokens=max_tokens
+    ).bind_tools(TOOLS)
+
 
 # =============================================================================
 # Langfuse Tracing Helpers
@@ -59,6 +187,21 @@ def _update_span_output(config: RunnableConfig, span: Any, output: str) -> None:
             logger.debug(f"[LANGFUSE] Failed to update span via .update(): {e}")
 
 
+def _update_span_prefetch(span: Any, future: Future) -> None:
+    """
+    Annotate a tool span whose search ran ahead on a pool thread.
+
+    The span itself only measures the wait for the result, so the search's
+    own duration is attached as metadata.
+    """
+    if span is None or not hasattr(span, "update") or future.exception() is not None:
+        return
+    try:
+        span.update(metadata={"prefetched": True, "search_ms": future.result().get("search_ms")})
+    except Exception as e:
+        logger.debug(f"[LANGFUSE] Failed to update span metadata: {e}")
+
+
 @contextmanager
 def langfuse_span(config: RunnableConfig, name: str, metadata: Optional[Dict[str, Any]] = None):
     """
@@ -84,8 +227,6 @@ def langfuse_span(config: RunnableConfig, name: str, metadata: Optional[Dict[str
         return
 
     try:
-        from app.observability.tracing import get_langfuse_client_for_user
-
         langfuse = get_langfuse_client_for_user(public_key, secret_key)
         if not langfuse:
             yield None
@@ -140,8 +281,6 @@ def _get_langfuse_callback(config: RunnableConfig) -> Optional[Any]:
         return None
 
     try:
-        from app.observability.tracing import get_callback_handler_for_user
-
         logger.info(f"[LANGFUSE] Attempting to create CallbackHandler (trace_id={trace_id[:8] if trace_id else 'none'}...)")
         handler = get_callback_handler_for_user(
             public_key=public_key,
@@ -167,8 +306,6 @@ def _get_langfuse_metadata(state: Dict[str, Any]) -> Dict[str, Any]:
     In Langfuse SDK v3, session_id is passed via metadata when invoking
     the LLM, enabling session-level metrics grouping.
     """
-    from app.observability.tracing import get_langfuse_metadata
-
     metadata = get_langfuse_metadata(
         session_id=state.get("session_id"),
         user_id=state.get("user_id"),
@@ -177,6 +314,73 @@ def _get_langfuse_metadata(state: Dict[str, Any]) -> Dict[str, Any]:
     return metadata
 
 
+class _CompiledPlan(NamedTuple):
+    """Static data derived once per plan shape."""
+
+    search_count: int
+    # (plan index, rendered "description - Query: ..." line) for each search step
+    search_lines: Tuple[Tuple[int, str], ...]
+
+
+@lru_cache(maxsize=128)
+def _compile_plan(plan_key: Tuple[Tuple[Any, Any, Any], ...]) -> _CompiledPlan:
+    """
+    Pre-render the static parts of an approved plan.
+
+    The agent re-enters once per plan step; caching by plan shape means the
+    search-step filtering and line formatting run once per plan, not per step.
+
+    Args:
+        plan_key: Tuple of (action, description, query) per plan step
+
+    Returns:
+        _CompiledPlan for the plan
+    """
+    search_lines = tuple(
+        (index, f"{description} - Query: \"{query}\"")
+        for index, (action, description, query) in enumerate(plan_key)
+        if action == "search"
+    )
+    return _CompiledPlan(search_count=len(search_lines), search_lines=search_lines)
+
+
+# Plan execution context, rendered per agent step with a single format() call
+_PLAN_CONTEXT_TEMPLATE = """
+## APPROVED PLAN EXECUTION
+
+You have an approved plan to execute for player: {player_name}
+
+**Plan Status:** Step {step_number} of {total_steps}
+
+**Remaining Search Steps:**
+{remaining_steps}{instruction}"""
+
+_SEARCHES_DONE_INSTRUCTION = """
+
+**ALL SEARCHES COMPLETE!**
+
+You have gathered all the information. Now you MUST:
+1. Compile the findings into a comprehensive scouting report
+2. Call the `save_player_report` tool with:
+   - player_name: The player's name
+   - report_summary: A 1-2 sentence summary of your findings
+
+This will trigger the player preview for user approval before saving to the database.
+DO NOT just respond with text - you MUST call the save_player_report tool!
+"""
+
+# Plan searches are independent, so the agent issues them all in one turn;
+# tool_node runs same-turn searches concurrently
+_NEXT_SEARCH_INSTRUCTION = """
+
+**INSTRUCTION:** The remaining search steps are independent. Execute ALL of them now:
+call `search_documents` once per query above, all in this single response (parallel tool calls), in the listed order.
+Do NOT respond with text - call the tools immediately!
+"""
+
+_RAG_PREVIEW_CHARS = 3000
+
+
 def agent_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
     """
     Main agent node - reasons and decides next action.
@@ -216,18 +420,16 @@ def agent_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
     max_tokens = state.get("max_tokens")  # Optional: limit response tokens (for benchmarking)
     logger.info(f"[AGENT_NODE] Using model: {selected_model}, max_tokens: {max_tokens}")
 
-    # Create LLM with tools (streaming callbacks for frontend only)
-    llm_kwargs = {
-        "model": selected_model,
-        "api_key": state["api_key"],
-        "temperature": 0.3,
-        "streaming": True,
-        "callbacks": callbacks,  # Frontend streaming callbacks only
-    }
-    if max_tokens is not None:
-        llm_kwargs["max_tokens"] = max_tokens
-
-    llm = ChatOpenAI(**llm_kwargs).bind_tools(TOOLS)
+    # Get cached LLM with tools (callbacks are passed per call in invoke config)
+    # Only stream when there is an event queue to receive tokens; otherwise a
+    # single non-streamed response is cheaper and carries aggregated usage.
+    llm = _get_tool_llm(
+        selected_model,
+        state["api_key"],
+        0.3,
+        streaming=event_queue is not None,
+        max_tokens=max_tokens,
+    )
 
     # Build context message
     context_parts = []
@@ -239,84 +441,71 @@ def agent_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
     player_name = state.get("player_name")
 
     if plan and plan_approved:
-        # Calculate remaining steps
-        remaining_steps = [s for s in plan[current_step_index:] if s.get("action") == "search"]
-        completed_steps = plan[:current_step_index]
-
-        # Build plan execution context
-        plan_context = f"""
-## APPROVED PLAN EXECUTION
-
-You have an approved plan to execute for player: {player_name}
-
-**Plan Status:** Step {current_step_index + 1} of {len(plan)}
+        compiled_plan = _compile_plan(tuple(
+            (s.get("action"), s.get("description", "Search"), s.get("query", ""))
+            for s in plan
+        ))
 
-**Remaining Search Steps:**
-"""
-        for i, step in enumerate(remaining_steps):
-            plan_context += f"\n{i+1}. {step.get('description', 'Search')} - Query: \"{step.get('query', '')}\""
+        # Remaining search steps from the current position
+        remaining_lines = [
+            line for index, line in compiled_plan.search_lines
+            if index >= current_step_index
+        ]
 
         # Check if all searches are done (current_step_index >= number of search steps)
-        search_steps = [s for s in plan if s.get("action") == "search"]
-        all_searches_done = current_step_index >= len(search_steps)
+        all_searches_done = current_step_index >= compiled_plan.search_count
 
         if all_searches_done and state.get("rag_context"):
-            plan_context += """
-
-**ALL SEARCHES COMPLETE!**
-
-You have gathered all the information. Now you MUST:
-1. Compile the findings into a comprehensive scouting report
-2. Call the `save_player_report` tool with:
-   - player_name: The player's name
-   - report_summary: A 1-2 sentence summary of your findings
-
-This will trigger the player preview for user approval before saving to the database.
-DO NOT just respond with text - you MUST call the save_player_report tool!
-"""
-        elif remaining_steps:
-            plan_context += """
-
-**INSTRUCTION:** Execute the next search step by calling `search_documents` with the query above.
-Do NOT respond with text - call the tool immediately!
-"""
+            instruction = _SEARCHES_DONE_INSTRUCTION
+        elif remaining_lines:
+            instruction = _NEXT_SEARCH_INSTRUCTION
+        else:
+            instruction = ""
 
-        context_parts.append(plan_context)
+        # Build plan execution context
+        context_parts.append(_PLAN_CONTEXT_TEMPLATE.format(
+            player_name=player_name,
+            step_number=current_step_index + 1,
+            total_steps=len(plan),
+            remaining_steps="".join(f"\n{i}. {line}" for i, line in enumerate(remaining_lines, 1)),
+            instruction=instruction,
+        ))
         logger.info(f"[AGENT_NODE] Plan execution: step={current_step_index}, total={len(plan)}, searches_done={all_searches_done}")
 
-    if state.get("tasks"):
-        task_list = "\n".join([
+    tasks = state.get("tasks")
+    if tasks:
+        task_list = "\n".join(
             f"[{'x' if t['status'] == 'completed' else ' '}] {t['description']}"
-            for t in state["tasks"]
-        ])
+            for t in tasks
+        )
         context_parts.append(f"Current tasks:\n{task_list}")
 
-    if state.get("rag_context"):
+    rag_context = state.get("rag_context")
+    if rag_context:
         # Truncate for context but indicate there's more
-        rag_preview = state['rag_context'][:3000]
-        if len(state['rag_context']) > 3000:
+        rag_preview = rag_context[:_RAG_PREVIEW_CHARS]
+        if len(rag_context) > _RAG_PREVIEW_CHARS:
             rag_preview += "\n... [truncated, full context available]"
         context_parts.append(f"Information gathered from searches:\n{rag_preview}")
 
-    context_msg = "\n\n".join(context_parts) if context_parts else "No context yet."
-
-    # Invoke LLM
+    # Invoke LLM (the system message is a module-level singleton)
     messages = [
-        SystemMessage(content=AGENT_SYSTEM_PROMPT),
+        _AGENT_SYSTEM_MSG,
         *state["messages"],
     ]
 
     # Add context as system message if we have any
     if context_parts:
+        context_msg = "\n\n".join(context_parts)
         messages.append(SystemMessage(content=f"[Current State]\n{context_msg}"))
 
     # Wrap agent LLM call in span for tracing
     with langfuse_span(config, "node:agent", metadata={"session_id": state.get("session_id")}) as agent_span:
-        # Include Langfuse callback + metadata for session-level grouping (SDK v3)
-        # Callback must be in config (not LLM constructor) for metadata to be picked up
-        invoke_config = {"metadata": langfuse_metadata}
+        # Include streaming + Langfuse callbacks and metadata for session-level grouping (SDK v3)
+        # Callbacks must be in config (not LLM constructor): the LLM is shared
         if langfuse_callback:
-            invoke_config["callbacks"] = [langfuse_callback]
+            callbacks.append(langfuse_callback)
+        invoke_config = {"metadata": langfuse_metadata, "callbacks": callbacks}
         response = llm.invoke(messages, config=invoke_config)
         _update_span_output(config, agent_span, f"has_tool_calls={bool(response.tool_calls)}")
 
@@ -328,50 +517,59 @@ Do NOT respond with text - call the tool immediately!
     }
 
 
-# =============================================================================
-# Planner Prompt
-# =============================================================================
+# Planner failures that a stronger model may not repeat
+_PLANNER_ESCALATION_ERRORS = (
+    OutputParserException,
+    ValidationError,
+    LengthFinishReasonError,
+    ContentFilterFinishReasonError,
+)
 
-PLANNER_SYSTEM_PROMPT = """You are a planning assistant for sports scouting.
-Analyze the user's request and create a structured execution plan.
-
-For scouting report requests, generate search steps to gather comprehensive information.
-
-Respond with valid JSON only, no markdown formatting:
-{
-  "player_name": "extracted player name or null",
-  "sport_guess": "guessed sport (football, basketball, etc.) or null",
-  "is_scouting_request": true/false,
-  "plan": [
-    {
-      "action": "search",
-      "description": "Search for player's basic information and career history",
-      "query": "player name basic information career history"
-    },
-    {
-      "action": "search",
-      "description": "Search for player's statistics and performance",
-      "query": "player name statistics performance"
-    },
-    {
-      "action": "search",
-      "description": "Search for player's strengths and weaknesses",
-      "query": "player name strengths weaknesses analysis"
-    },
-    {
-      "action": "synthesize",
-      "description": "Compile findings into comprehensive scouting report",
-      "query": null
-    }
-  ]
-}
 
-Rules:
-- For scouting requests, generate 3-5 search steps covering different aspects
-- Each search step should have a specific, targeted query
-- Include a final "synthesize" step to compile the report
-- For simple questions, set is_scouting_request to false and plan to empty array
-- Always extract player_name if one is mentioned"""
+def _invoke_planner_cascade(
+    selected_model: str,
+    api_key: str,
+    messages: List[Any],
+    invoke_config: Dict[str, Any],
+) -> PlannerOutput:
+    """
+    Run the planner on PLANNER_CHEAP_MODEL, escalating to the selected model.
+
+    Escalates once when the cheap model's output fails schema validation, is
+    cut off by PLANNER_MAX_TOKENS or refused by the content filter (strict
+    structured output raises instead of returning a partial plan), or a
+    scouting request comes back without a player name.
+
+    Args:
+        selected_model: Model selected by the user (escalation target)
+        api_key: OpenAI API key
+        messages: Planner prompt messages
+        invoke_config: Invoke config with streaming/Langfuse callbacks and metadata
+
+    Returns:
+        Validated PlannerOutput
+    """
+    cascade = [PLANNER_CHEAP_MODEL]
+    if selected_model != PLANNER_CHEAP_MODEL:
+        cascade.append(selected_model)
+
+    for attempt, model in enumerate(cascade, 1):
+        is_last = attempt == len(cascade)
+        planner_llm = _get_structured_llm(model, api_key, 0, PlannerOutput, PLANNER_MAX_TOKENS)
+
+        try:
+            planner_output = planner_llm.invoke(messages, config=invoke_config)
+        except _PLANNER_ESCALATION_ERRORS as e:
+            if is_last:
+                raise
+            logger.info(f"[PLANNER_NODE] Cascade escalation {model} -> {cascade[attempt]}: invalid output ({e})")
+            continue
+
+        if planner_output.is_scouting_request and not planner_output.player_name and not is_last:
+            logger.info(f"[PLANNER_NODE] Cascade escalation {model} -> {cascade[attempt]}: missing player_name")
+            continue
+
+        return planner_output
 
 
 def planner_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
@@ -387,8 +585,6 @@ def planner_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
     For simple questions:
     - Skips planning, lets agent handle directly
     """
-    import json
-
     logger.info(f"[PLANNER_NODE] Generating plan for session={state['session_id']}")
 
     # Emit status for frontend display
@@ -414,6 +610,17 @@ def planner_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
             "plan_approved": True,  # Skip approval if no plan needed
         }
 
+    # Fast path: greetings and quick player questions never need a plan,
+    # so skip the planner LLM and let the agent answer directly
+    intent = classify_intent(user_message)
+    if intent in NO_PLAN_INTENTS:
+        logger.info(f"[PLANNER_NODE] Fast path: intent={intent}, skipping planner LLM")
+        emit_status(config, "planner", "Plan generated", is_completed=True)
+        return {
+            "plan": None,
+            "plan_approved": True,
+        }
+
     # Set up callbacks for frontend streaming
     callbacks = []
 
@@ -428,42 +635,74 @@ def planner_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
     langfuse_metadata = _get_langfuse_metadata(state)
 
     # Get model from state (selected by user in chat UI)
-    # For planning, we use the same model the user selected
+    # Planning tries PLANNER_CHEAP_MODEL first and escalates to this model
     selected_model = state.get("model", "gpt-4o-mini")
-    logger.info(f"[PLANNER_NODE] Using model: {selected_model}")
+    logger.info(f"[PLANNER_NODE] Using model: {PLANNER_CHEAP_MODEL} (escalation: {selected_model})")
 
-    planner_llm = ChatOpenAI(
-        model=selected_model,
-        api_key=state["api_key"],
-        temperature=0,
-        callbacks=callbacks,  # Frontend streaming callbacks only
-    )
+    planner_messages = [
+        _PLANNER_SYSTEM_MSG,
+        HumanMessage(content=f"Create a plan for this request: {user_message}"),
+    ]
+    # Planning is deterministic (temperature=0): reuse cached plans for repeated requests
+    cache_key = llm_cache.cache_key(selected_model, planner_messages, 0, namespace=str(state["user_id"]))
+
+    # Reuse a plan template when the message itself is an unambiguous request
+    # to create a report (player and sport named), skipping the planner LLM call
+    template_plan = None
+    template_match = match_template_request(user_message) if intent == SCOUTING_INTENT else None
+    if template_match:
+        template_player, template_sport = template_match
+        template_plan = plan_templates.get(
+            str(state["user_id"]), intent, template_sport, template_player
+        )
 
     try:
-        # Wrap planner LLM call in span for tracing
-        with langfuse_span(config, "node:planner", metadata={"user_message": user_message[:200]}) as planner_span:
-            # Include Langfuse callback + metadata for session-level grouping (SDK v3)
-            invoke_config = {"metadata": langfuse_metadata}
-            if langfuse_callback:
-                invoke_config["callbacks"] = [langfuse_callback]
-            response = planner_llm.invoke(
-                [
-                    SystemMessage(content=PLANNER_SYSTEM_PROMPT),
-                    HumanMessage(content=f"Create a plan for this request: {user_message}"),
-                ],
-                config=invoke_config,
-            )
-            _update_span_output(config, planner_span, response.content[:500] if response.content else "")
-
-        # Parse JSON response
-        response_text = response.content.strip()
-        # Remove markdown code blocks if present
-        if response_text.startswith("```"):
-            response_text = response_text.split("```")[1]
-            if response_text.startswith("json"):
-                response_text = response_text[4:]
-
-        plan_data = json.loads(response_text)
+        if template_plan is not None:
+            logger.info(f"[PLANNER_NODE] Using cached plan template for player={template_player}")
+            plan_data = {
+                "player_name": template_player,
+                "sport_guess": template_sport,
+                "is_scouting_request": True,
+                "plan": template_plan,
+            }
+        else:
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                logger.info("[PLANNER_NODE] Using cached plan response")
+                planner_output = PlannerOutput.model_validate_json(cached)
+            else:
+                # Wrap planner LLM call in span for tracing
+                with langfuse_span(config, "node:planner", metadata={"user_message": user_message[:200]}) as planner_span:
+                    # Include Langfuse callback + metadata for session-level grouping (SDK v3)
+                    # Callbacks must be in config (not LLM constructor): the LLM is shared
+                    if langfuse_callback:
+                        callbacks.append(langfuse_callback)
+                    invoke_config = {"metadata": langfuse_metadata, "callbacks": callbacks}
+                    planner_output = _invoke_planner_cascade(
+                        selected_model,
+                        state["api_key"],
+                        planner_messages,
+                        invoke_config,
+                    )
+                    _update_span_output(config, planner_span, planner_output.model_dump_json()[:500])
+                llm_cache.set(cache_key, planner_output.model_dump_json())
+
+            plan_data = planner_output.model_dump()
+            # Only a plan for a template-shaped request is generic enough to reuse,
+            # and only if the LLM read the same player and sport from it
+            if (
+                template_match
+                and plan_data["is_scouting_request"]
+                and plan_data["player_name"] == template_player
+                and (plan_data["sport_guess"] or "").lower() == template_sport
+            ):
+                plan_templates.put(
+                    str(state["user_id"]),
+                    intent,
+                    plan_data["sport_guess"],
+                    plan_data["player_name"],
+                    plan_data["plan"],
+                )
 
         is_scouting = plan_data.get("is_scouting_request", False)
         player_name = plan_data.get("player_name")
@@ -484,6 +723,7 @@ def planner_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
         if player_name:
             from .tools import execute_list_reports
             logger.info(f"[PLANNER_NODE] Checking existing reports for player={player_name}")
+            emit_status(config, "planner", f"Checking existing reports for {player_name}...")
             with langfuse_span(config, "tool:list_reports", metadata={"player_name": player_name, "source": "planner_node"}) as span:
                 existing_reports = execute_list_reports(
                     player_name=player_name,
@@ -550,8 +790,8 @@ def planner_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
             "approval_payload": approval_payload,
         }
 
-    except json.JSONDecodeError as e:
-        logger.error(f"[PLANNER_NODE] Failed to parse plan JSON: {e}")
+    except (OutputParserException, ValidationError) as e:
+        logger.error(f"[PLANNER_NODE] Failed to parse structured plan: {e}")
         emit_status(config, "planner", "Plan generated", is_completed=True)
         return {
             "plan": None,
@@ -566,6 +806,27 @@ def planner_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
         }
 
 
+def _emit_skipped_steps(config: RunnableConfig, plan: Optional[list], start_index: int) -> None:
+    """
+    Mark the remaining plan steps as skipped after a HITL rejection.
+
+    The run ends right after a rejection, so this lets the frontend settle the
+    plan panel instead of leaving steps pending.
+    """
+    if not plan:
+        return
+
+    total_steps = len(plan)
+    for step_index in range(start_index, total_steps):
+        emit_plan_step_progress(
+            config,
+            step_index,
+            total_steps,
+            "skipped",
+            plan[step_index].get("description", ""),
+        )
+
+
 def plan_approval_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
     """
     HITL plan approval node.
@@ -602,14 +863,17 @@ def plan_approval_node(state: AgentState, config: RunnableConfig) -> Dict[str, A
 
     if not approved:
         logger.info(f"[PLAN_APPROVAL_NODE] Plan rejected by user for session={state['session_id']}")
+        _emit_skipped_steps(config, state.get("plan"), 0)
         emit_status(config, "plan_approval", "Plan rejected", is_completed=True)
         # Return state that will lead to END (no plan to execute)
         return {
             "needs_user_approval": False,
             "approval_type": None,
             "approval_payload": None,
+            "approval_rejected": True,
             "plan": None,  # Clear the plan
             "plan_approved": False,
+            "messages": [AIMessage(content="Plan cancelled. Let me know if you'd like to adjust the request or try a different player.")],
         }
 
     # Plan was approved - continue execution
@@ -618,11 +882,100 @@ def plan_approval_node(state: AgentState, config: RunnableConfig) -> Dict[str, A
         "needs_user_approval": False,
         "approval_type": None,
         "approval_payload": None,
+        "approval_rejected": False,
         "plan_approved": True,
         "current_step_index": 0,  # Start from first step
     }
 
 
+# Shared pool for running independent search tool calls concurrently
+_SEARCH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="search_tool")
+
+
+def _validated_search_query(tool_args: Dict[str, Any]) -> str:
+    """Validate and clean a search_documents query, falling back to the raw value."""
+    try:
+        return SearchDocumentsInput(query=tool_args.get("query", "")).query
+    except ValidationError as e:
+        logger.warning(f"[TOOL_NODE] search_documents validation error: {e}")
+        return tool_args.get("query", "")
+
+
+_QUERY_STOPWORDS = frozenset({"the", "a", "an", "and", "of", "for", "in", "on"})
+
+
+def _search_query_key(query: str) -> frozenset:
+    """
+    Normalize a search query to its content-word set.
+
+    "Haaland stats" and "stats for Haaland" map to the same key, while a
+    more specific query ("Haaland stats 2023") stays distinct.
+    """
+    return frozenset(query.lower().split()) - _QUERY_STOPWORDS
+
+
+def _run_search(query: str, user_id: int, api_key: str) -> Dict[str, Any]:
+    """
+    Run the retrieval half of search_documents on a pool thread.
+
+    Keeps the thread's DB connection healthy and records the search's own
+    duration as "search_ms" on the result, since the tool span in tool_node
+    only sees the time spent waiting for it.
+    """
+    from django.db import close_old_connections
+
+    close_old_connections()
+    started = time.perf_counter()
+    try:
+        result = retrieve_search_documents(query, user_id, api_key)
+        result["search_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return result
+    finally:
+        close_old_connections()
+
+
+def _prefetch_searches(
+    tool_calls: List[Dict[str, Any]],
+    state: AgentState,
+) -> Dict[str, Future]:
+    """
+    Start the retrieval of all search_documents calls of one agent turn concurrently.
+
+    Retrieval (embedding + vector query) is independent per query, so when
+    the agent issues several searches at once their latency overlaps instead
+    of adding up. Pool threads touch no shared state: tool_node consumes the
+    futures in call order and applies seen-chunk filtering and the
+    source/seen set updates on its own thread, so which excerpts each
+    section gets is the same as with sequential execution.
+
+    Args:
+        tool_calls: Tool calls from the agent's last message
+        state: Current agent state
+
+    Returns:
+        Dict of tool_call id -> Future with the retrieval result
+    """
+    search_calls = [tc for tc in tool_calls if tc["name"] == "search_documents"]
+    if len(search_calls) < 2:
+        return {}
+
+    futures: Dict[str, Future] = {}
+    futures_by_key: Dict[frozenset, Future] = {}
+    for tc in search_calls:
+        query = _validated_search_query(tc["args"])
+        key = _search_query_key(query)
+        # Duplicate queries in one turn (e.g. reordered words) share one search
+        if key not in futures_by_key:
+            futures_by_key[key] = _SEARCH_POOL.submit(
+                _run_search,
+                query,
+                state["user_id"],
+                state["api_key"],
+            )
+        futures[tc["id"]] = futures_by_key[key]
+    return futures
+
+
 def tool_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
     """
     Execute tools called by the agent.
@@ -642,6 +995,9 @@ def tool_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
 
     results = []
     rag_context = state.get("rag_context", "")
+    # Kept as a live set so each search only adds its own doc IDs
+    source_doc_ids = set(state.get("source_doc_ids") or [])
+    seen_chunk_ids = set(state.get("seen_chunk_ids") or [])
     needs_approval = False
     approval_payload = None
 
@@ -651,6 +1007,11 @@ def tool_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
     total_steps = len(plan) if plan else 0
     tool_call_count = 0
 
+    # Overlap independent searches; the loop below collects them in order
+    search_futures = _prefetch_searches(tool_calls, state)
+    # Normalized queries already answered this turn
+    searched_keys = set()
+
     for tool_call in tool_calls:
         tool_name = tool_call["name"]
         tool_args = tool_call["args"]
@@ -686,30 +1047,43 @@ def tool_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
                 )
                 player_name = validated_input.player_name
                 report_summary = validated_input.report_summary
+                inputs_validated = True
             except ValidationError as e:
                 logger.warning(f"[TOOL_NODE] save_player_report input validation error: {e}")
                 player_name = tool_args.get("player_name", "Unknown")
                 report_summary = tool_args.get("report_summary", "")
+                inputs_validated = False
 
-            # Build validated approval payload
-            try:
-                validated_payload = ApprovalPayload(
+            if inputs_validated:
+                # Inputs passed SavePlayerReportInput and the rest comes from
+                # graph state, so skip a second validation pass over the
+                # (potentially large) report_text.
+                approval_payload = ApprovalPayload.model_construct(
                     player_name=player_name,
                     report_summary=report_summary,
                     player_data=state.get("player_data"),
                     session_id=state["session_id"],
                     report_text=rag_context,  # Include gathered context for report
-                )
-                approval_payload = validated_payload.model_dump()
-            except ValidationError as e:
-                logger.warning(f"[TOOL_NODE] ApprovalPayload validation error: {e}")
-                # Fall back to dict if validation fails
-                approval_payload = {
-                    "player_name": player_name,
-                    "report_summary": report_summary,
-                    "player_data": state.get("player_data"),
-                    "session_id": state["session_id"],
-                }
+                ).model_dump()
+            else:
+                # Raw tool args: build a validated approval payload
+                try:
+                    approval_payload = ApprovalPayload(
+                        player_name=player_name,
+                        report_summary=report_summary,
+                        player_data=state.get("player_data"),
+                        session_id=state["session_id"],
+                        report_text=rag_context,  # Include gathered context for report
+                    ).model_dump()
+                except ValidationError as e:
+                    logger.warning(f"[TOOL_NODE] ApprovalPayload validation error: {e}")
+                    # Fall back to dict if validation fails
+                    approval_payload = {
+                        "player_name": player_name,
+                        "report_summary": report_summary,
+                        "player_data": state.get("player_data"),
+                        "session_id": state["session_id"],
+                    }
 
             # Don't execute yet - will execute after approval
             results.append(ToolMessage(
@@ -731,25 +1105,31 @@ def tool_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
             # Inject user context and validate inputs
             if tool_name == "search_documents":
                 # Validate search input
-                try:
-                    validated_input = SearchDocumentsInput(
-                        query=tool_args.get("query", "")
-                    )
-                    query = validated_input.query
-                except ValidationError as e:
-                    logger.warning(f"[TOOL_NODE] search_documents validation error: {e}")
-                    query = tool_args.get("query", "")
-
-                # Wrap tool execution in Langfuse span for detailed tracing
-                with langfuse_span(config, f"tool:search_documents", metadata={"query": query}) as span:
-                    result = executor(
-                        query=query,
-                        user_id=state["user_id"],
-                        api_key=state["api_key"],
-                    )
-                    _update_span_output(config, span, str(result)[:500])
-                # Accumulate RAG context
-                rag_context += f"\n\n### Search: {query}\n{result}"
+                query = _validated_search_query(tool_args)
+                query_key = _search_query_key(query)
+
+                if query_key in searched_keys:
+                    # Same content words as an earlier search this turn: its
+                    # results are already in rag_context
+                    result = "Duplicate of an earlier search in this turn; see those results."
+                else:
+                    searched_keys.add(query_key)
+                    # Wrap tool execution in Langfuse span for detailed tracing
+                    future = search_futures.get(tool_call["id"])
+                    with langfuse_span(config, f"tool:search_documents", metadata={"query": query}) as span:
+                        result = executor(
+                            query=query,
+                            user_id=state["user_id"],
+                            api_key=state["api_key"],
+                            source_doc_ids=source_doc_ids,
+                            seen_chunk_ids=seen_chunk_ids,
+                            prefetched=future,
+                        )
+                        _update_span_output(config, span, str(result)[:500])
+                        if future is not None:
+                            _update_span_prefetch(span, future)
+                    # Accumulate RAG context
+                    rag_context += f"\n\n### Search: {query}\n{result}"
             elif tool_name == "list_reports":
                 # list_reports needs user_id for multi-tenant filtering
                 player_name = tool_args.get("player_name")
@@ -809,6 +1189,8 @@ def tool_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
     return {
         "messages": results,
         "rag_context": rag_context,
+        "source_doc_ids": sorted(source_doc_ids),
+        "seen_chunk_ids": sorted(seen_chunk_ids),
         "needs_user_approval": needs_approval,
         "approval_type": ApprovalType.SAVE_PLAYER.value if needs_approval else None,
         "approval_payload": approval_payload,
@@ -816,52 +1198,35 @@ def tool_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
     }
 
 
-# =============================================================================
-# Report Composition Prompt
-# =============================================================================
+_SEARCH_SECTION_MARKER = "### Search: "
 
-COMPOSER_SYSTEM_PROMPT = """You are a professional sports scouting report writer.
-Given search results about a player, compose a comprehensive scouting report.
-
-Your task is to:
-1. Extract structured player information
-2. Identify strengths and weaknesses
-3. Write a professional report narrative
-
-Respond with valid JSON only, no markdown formatting:
-{
-  "player_profile": {
-    "display_name": "Full player name",
-    "sport": "football" or "basketball" or "nba",
-    "positions": ["Position1", "Position2"],
-    "teams": ["Current Team"],
-    "league": "League name if known",
-    "physical": {
-      "height_cm": null or number,
-      "weight_kg": null or number
-    }
-  },
-  "scouting_assessment": {
-    "strengths": ["Strength 1", "Strength 2", "Strength 3"],
-    "weaknesses": ["Weakness 1", "Weakness 2"],
-    "style_tags": ["Tag1", "Tag2"],
-    "role_projection": "Brief description of player's potential role"
-  },
-  "report_summary": [
-    "Key finding 1 in a complete sentence",
-    "Key finding 2 in a complete sentence",
-    "Key finding 3 in a complete sentence"
-  ],
-  "report_text": "A comprehensive 3-5 paragraph professional scouting report narrative that covers:\\n\\n1. Player overview and background\\n2. Technical abilities and playing style\\n3. Physical attributes and athleticism\\n4. Areas for improvement\\n5. Overall assessment and potential"
-}
-
-Guidelines:
-- Extract only information that is present in the search results
-- Use null for fields where information is not available
-- Write the report_text as a professional scouting narrative
-- Include specific details and observations from the search results
-- Be objective and analytical in tone
-- The report_text should be substantial (at least 200 words)"""
+
+def _fit_search_results(rag_context: str, model: str) -> str:
+    """
+    Trim accumulated search results to the composer's token budget.
+
+    rag_context is a sequence of "### Search: ..." sections in plan order;
+    whole sections are kept until COMPOSER_MAX_CONTEXT_TOKENS is reached.
+
+    Args:
+        rag_context: Accumulated search results from tool_node
+        model: Model name for tokenizer selection
+
+    Returns:
+        Search results that fit within the budget
+    """
+    sections = [
+        _SEARCH_SECTION_MARKER + section.strip()
+        for section in rag_context.split(_SEARCH_SECTION_MARKER)
+        if section.strip()
+    ]
+    fitted = fit_to_token_budget(sections, COMPOSER_MAX_CONTEXT_TOKENS, model)
+    if len(fitted) < len(sections):
+        logger.info(f"[COMPOSE_REPORT_NODE] Kept {len(fitted)}/{len(sections)} search sections within {COMPOSER_MAX_CONTEXT_TOKENS} tokens")
+    if not fitted:
+        # A single oversized section: keep its head (~4 chars per token)
+        return sections[0][:COMPOSER_MAX_CONTEXT_TOKENS * 4] if sections else rag_context
+    return "\n\n".join(fitted)
 
 
 def compose_report_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
@@ -874,8 +1239,6 @@ def compose_report_node(state: AgentState, config: RunnableConfig) -> Dict[str,
     3. Generates a professional report narrative
     4. Prepares the approval payload for the player preview
     """
-    import json
-
     logger.info(f"[COMPOSE_REPORT_NODE] Composing report for session={state['session_id']}")
 
     # Emit status for frontend display
@@ -891,8 +1254,10 @@ def compose_report_node(state: AgentState, config: RunnableConfig) -> Dict[str,
     player_name = state.get("player_name", "Unknown Player")
     sport_guess = state.get("sport_guess", "unknown")
 
-    if not rag_context:
-        logger.warning("[COMPOSE_REPORT_NODE] No RAG context available")
+    # seen_chunk_ids is empty when every search came back without excerpts
+    # (no matches or errors): the LLM would only write a stub, so skip it.
+    if not rag_context or not state.get("seen_chunk_ids"):
+        logger.warning(f"[COMPOSE_REPORT_NODE] No document evidence available, short-circuiting composition (context_chars={len(rag_context)})")
         emit_status(config, "compose_report", "Report composed", is_completed=True)
         # Fall back to basic report
         return {
@@ -919,71 +1284,48 @@ def compose_report_node(state: AgentState, config: RunnableConfig) -> Dict[str,
     selected_model = state.get("model", "gpt-4o-mini")
     logger.info(f"[COMPOSE_REPORT_NODE] Using model: {selected_model}")
 
-    # Create LLM for composition
-    composer_llm = ChatOpenAI(
-        model=selected_model,
-        api_key=state["api_key"],
-        temperature=0.5,  # Slightly higher for more creative writing
-        callbacks=callbacks,  # Frontend streaming callbacks only
-    )
+    # Shared LLM for composition; 0.5 is slightly higher for more creative writing
+    composer_llm = _get_structured_llm(selected_model, state["api_key"], 0.5, ScoutingReportDraft)
 
     try:
         # Prepare the prompt with search results
-        composition_prompt = f"""Compose a scouting report for player: {player_name}
-Sport: {sport_guess}
+        # Static instructions first, per-request data at the tail, so the cached
+        # prompt prefix extends past the system message into this one.
+        composition_prompt = f"""Based on the search results below, create a comprehensive scouting report.
 
-Here are the search results gathered from documents:
+Player: {player_name}
+Sport: {sport_guess}
 
-{rag_context}
+Search results gathered from documents:
 
-Based on this information, create a comprehensive scouting report following the JSON format specified."""
+{_fit_search_results(rag_context, selected_model)}"""
 
         # Wrap composer LLM call in span for tracing
         with langfuse_span(config, "node:composer", metadata={"player_name": player_name, "sport": sport_guess}) as composer_span:
             # Include Langfuse callback + metadata for session-level grouping (SDK v3)
-            invoke_config = {"metadata": langfuse_metadata}
+            # Callbacks must be in config (not LLM constructor): the LLM is shared
             if langfuse_callback:
-                invoke_config["callbacks"] = [langfuse_callback]
-            response = composer_llm.invoke(
+                callbacks.append(langfuse_callback)
+            invoke_config = {"metadata": langfuse_metadata, "callbacks": callbacks}
+            report_draft = composer_llm.invoke(
                 [
-                    SystemMessage(content=COMPOSER_SYSTEM_PROMPT),
+                    _COMPOSER_SYSTEM_MSG,
                     HumanMessage(content=composition_prompt),
                 ],
                 config=invoke_config,
             )
-            _update_span_output(config, composer_span, response.content[:500] if response.content else "")
-
-        # Parse the JSON response
-        response_text = response.content.strip()
-        # Remove markdown code blocks if present
-        if response_text.startswith("```"):
-            lines = response_text.split("\n")
-            response_text = "\n".join(lines[1:-1])
-            if response_text.startswith("json"):
-                response_text = response_text[4:]
-
-        report_data = json.loads(response_text)
-
-        # Extract the composed data
-        player_profile = report_data.get("player_profile", {})
-        scouting_assessment = report_data.get("scouting_assessment", {})
-        report_summary = report_data.get("report_summary", [])
-        report_text = report_data.get("report_text", "")
-
-        # Build player_data for approval
+            _update_span_output(config, composer_span, report_draft.model_dump_json()[:500])
+
+        # The draft is schema-validated, so every field is present: build
+        # player_data with one merge instead of per-key .get() defaults
+        report_summary = report_draft.report_summary
+        report_text = report_draft.report_text
+        profile = report_draft.player_profile
         player_data = {
-            "display_name": player_profile.get("display_name", player_name),
-            "sport": player_profile.get("sport", sport_guess),
-            "positions": player_profile.get("positions", []),
-            "teams": player_profile.get("teams", []),
-            "league": player_profile.get("league"),
-            "physical": player_profile.get("physical", {}),
-            "scouting": {
-                "strengths": scouting_assessment.get("strengths", []),
-                "weaknesses": scouting_assessment.get("weaknesses", []),
-                "style_tags": scouting_assessment.get("style_tags", []),
-                "role_projection": scouting_assessment.get("role_projection"),
-            },
+            **profile.model_dump(),
+            "display_name": profile.display_name or player_name,
+            "sport": profile.sport or sport_guess,
+            "scouting": report_draft.scouting_assessment.model_dump(),
         }
 
         logger.info(f"[COMPOSE_REPORT_NODE] Successfully composed report for {player_name}")
@@ -1010,8 +1352,8 @@ Based on this information, create a comprehensive scouting report following the
             "approval_payload": approval_payload,
         }
 
-    except json.JSONDecodeError as e:
-        logger.error(f"[COMPOSE_REPORT_NODE] Failed to parse composition JSON: {e}")
+    except (OutputParserException, ValidationError) as e:
+        logger.error(f"[COMPOSE_REPORT_NODE] Failed to parse structured report: {e}")
         emit_status(config, "compose_report", "Report composed", is_completed=True)
         # Fall back to basic report using raw context
         return {
@@ -1056,6 +1398,31 @@ Based on this information, create a comprehensive scouting report following the
         }
 
 
+def _save_run_id(state: AgentState, report_text: str) -> str:
+    """
+    Build the idempotency key for saving a report.
+
+    Keyed on the save_player_report tool call being approved: that ID lives in
+    checkpointed state, so an approval that runs again (workflow retry or
+    resume) maps to the report saved the first time, while a later, deliberate
+    save (a new tool call) gets a new key even if the report text is identical.
+    Falls back to a hash of the report when no tool call is found.
+
+    Args:
+        state: Current agent state
+        report_text: Report being saved
+
+    Returns:
+        Run ID, also stored on the report for correlation
+    """
+    for message in reversed(state["messages"]):
+        for tool_call in getattr(message, "tool_calls", None) or ():
+            if tool_call.get("name") == "save_player_report" and tool_call.get("id"):
+                return f"{state['session_id']}:{tool_call['id']}"
+    digest = hashlib.sha256((report_text or "").encode("utf-8")).hexdigest()[:16]
+    return f"{state['session_id']}:{digest}"
+
+
 def approval_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
     """
     HITL approval node for save_player.
@@ -1092,12 +1459,14 @@ def approval_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
 
     if action == "reject":
         logger.info(f"[APPROVAL_NODE] Player save rejected for session={state['session_id']}")
+        _emit_skipped_steps(config, state.get("plan"), state.get("current_step_index", 0))
         emit_status(config, "approval", "Save cancelled", is_completed=True)
-        # Add a message indicating rejection
+        # Add a message indicating rejection (run ends here, no agent call)
         return {
             "needs_user_approval": False,
             "approval_type": None,
             "approval_payload": None,
+            "approval_rejected": True,
             "messages": [AIMessage(content="Player save cancelled. Let me know if you'd like to make any changes or create a different report.")],
         }
 
@@ -1121,6 +1490,8 @@ def approval_node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
                 player_data=player_data,
                 report_text=report_text,
                 user_id=user_id,
+                source_doc_ids=state.get("source_doc_ids"),
+                run_id=_save_run_id(state, report_text),
             )
 
             # Result is a dict with success, player_id, report_id, message
@@ -1142,6 +1513,7 @@ The report has been saved and is now available in your Scout Reports page."""
                     "needs_user_approval": False,
                     "approval_type": None,
                     "approval_payload": None,
+                    "approval_rejected": False,
                     "messages": [AIMessage(content=success_message)],
                     "player_data": {
                         "player_id": result.get("player_id"),
@@ -1158,6 +1530,7 @@ The report has been saved and is now available in your Scout Reports page."""
                     "needs_user_approval": False,
                     "approval_type": None,
                     "approval_payload": None,
+                    "approval_rejected": False,
                     "messages": [AIMessage(content=f"Error saving player report: {error_msg}. Please try again.")],
                 }
         else:
@@ -1167,6 +1540,7 @@ The report has been saved and is now available in your Scout Reports page."""
                 "needs_user_approval": False,
                 "approval_type": None,
                 "approval_payload": None,
+                "approval_rejected": False,
                 "messages": [AIMessage(content="Error: Could not save player report. Please try again.")],
             }
 
@@ -1178,5 +1552,6 @@ The report has been saved and is now available in your Scout Reports page."""
             "needs_user_approval": False,
             "approval_type": None,
             "approval_payload": None,
+            "approval_rejected": False,
             "messages": [AIMessage(content=f"Error saving player report: {str(e)}. Please try again.")],
         }
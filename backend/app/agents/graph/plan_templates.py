@@ -0,0 +1,212 @@
+"""
+Plan template cache for the planner node.
+
+Scouting plans are largely determined by the request intent and sport: the
+steps are the same searches with a different player name. Plans generated by
+the LLM are stored with the player name replaced by a placeholder, so later
+requests with the same intent can reuse them without a planner LLM call.
+
+Templates only apply when the message itself settles everything the planner
+LLM would decide (see match_template_request): it asks to create a report,
+names the player right after "report on/for/..." at the end of the message,
+and names the sport, which must match the sport the LLM confirmed for the
+stored template. Anything
+ambiguous goes through the LLM planner as before. Messages that are clearly
+not scouting requests (greetings, quick player questions) need no plan at
+all and skip the planner LLM entirely.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+SCOUTING_INTENT = "scouting_report"
+CHAT_INTENT = "general_chat"
+INFO_INTENT = "info_query"
+OTHER_INTENT = "other"
+# Intents that never produce a plan (the agent answers directly)
+NO_PLAN_INTENTS = frozenset({CHAT_INTENT, INFO_INTENT})
+PLAYER_PLACEHOLDER = "{PLAYER}"
+
+_MAX_TEMPLATES = 64
+_TEMPLATE_FIELDS = ("description", "query")
+
+_SCOUTING_INTENT_RE = re.compile(r"\b(scout\w*|report|analy[sz]e|analysis|profile)\b", re.IGNORECASE)
+_CHAT_RE = re.compile(r"^\s*(hi|hello|hey|thanks|thank you|ok|okay)( there)?[\s!.,?]*$", re.IGNORECASE)
+_INFO_RE = re.compile(r"^\s*(who is|who's|tell me about|what (is|are))\b", re.IGNORECASE)
+# Quick questions only: longer or multi-clause messages go to the planner LLM
+_MAX_INFO_WORDS = 10
+_CLAUSE_BREAK_RE = re.compile(r"[.?!;,:\n]|\b(and|but|because|so|then)\b", re.IGNORECASE)
+# "... report on/for/about Erling Haaland" - up to four capitalized words directly
+# after the report noun, so "Scout Haaland for Manchester City" does not match
+_PLAYER_NAME_RE = re.compile(
+    r"\b(?:[Rr]eport|[Pp]rofile)\s+(?:on|for|about|of)\s+([A-Z][\w'.-]*(?:\s+[A-Z][\w'.-]*){0,3})"
+)
+# Only punctuation may follow the player name; "... on X focusing on injuries"
+# carries a focus the generic template would drop
+_TRAILING_PUNCT_RE = re.compile(r"[\W_]*")
+# Requests to create a report; "show me the report for X" is left to the LLM
+_CREATE_RE = re.compile(r"\b(create|generate|make|write|build|prepare|draft)\b", re.IGNORECASE)
+_SPORT_KEYWORDS: Tuple[Tuple[re.Pattern, str], ...] = (
+    (re.compile(r"\b(nba|basketball)\b", re.IGNORECASE), "basketball"),
+    (re.compile(r"\b(football|soccer|premier league|la liga)\b", re.IGNORECASE), "football"),
+)
+
+
+def _is_single_clause(message: str) -> bool:
+    """Check that a message is one short clause (trailing punctuation allowed)."""
+    text = message.strip().rstrip("?!. ")
+    return len(text.split()) <= _MAX_INFO_WORDS and not _CLAUSE_BREAK_RE.search(text)
+
+
+def classify_intent(message: str) -> str:
+    """
+    Classify a user message by intent using precompiled patterns.
+
+    Scouting keywords take precedence, so "tell me about X's report" still
+    goes to the planner. Only short single-clause questions count as
+    INFO_INTENT; anything longer is OTHER_INTENT and left to the planner.
+
+    Args:
+        message: User message
+
+    Returns:
+        One of SCOUTING_INTENT, CHAT_INTENT, INFO_INTENT or OTHER_INTENT
+    """
+    if _SCOUTING_INTENT_RE.search(message):
+        return SCOUTING_INTENT
+    if _CHAT_RE.match(message):
+        return CHAT_INTENT
+    if _INFO_RE.match(message) and _is_single_clause(message):
+        return INFO_INTENT
+    return OTHER_INTENT
+
+
+def infer_sport(message: str) -> Optional[str]:
+    """Infer the sport from explicit keywords in the message."""
+    for pattern, sport in _SPORT_KEYWORDS:
+        if pattern.search(message):
+            return sport
+    return None
+
+
+def match_template_request(message: str) -> Optional[Tuple[str, str]]:
+    """
+    Read player and sport from an unambiguous request to create a scouting report.
+
+    Args:
+        message: User message already classified as SCOUTING_INTENT
+
+    Returns:
+        Tuple of (player_name, sport), or None if the planner LLM should decide
+    """
+    if not _CREATE_RE.search(message):
+        return None
+    sport = infer_sport(message)
+    if not sport:
+        return None
+    match = _PLAYER_NAME_RE.search(message)
+    if not match or not _TRAILING_PUNCT_RE.fullmatch(message, match.end()):
+        return None
+    return match.group(1).rstrip(".'"), sport
+
+
+def _replace_in_steps(steps: List[Dict[str, Any]], old: str, new: str) -> List[Dict[str, Any]]:
+    """Copy plan steps, replacing old with new in text fields."""
+    return [
+        {
+            key: value.replace(old, new) if key in _TEMPLATE_FIELDS and isinstance(value, str) else value
+            for key, value in step.items()
+        }
+        for step in steps
+    ]
+
+
+class PlanTemplateCache:
+    """Thread-safe LRU of plan templates keyed by (namespace, intent, sport).
+
+    Templates are only stored and served for a known sport; there is no
+    cross-sport fallback.
+    """
+
+    def __init__(self, max_templates: int = _MAX_TEMPLATES):
+        self._templates: "OrderedDict[Tuple[str, str, str], List[Dict[str, Any]]]" = OrderedDict()
+        self._max_templates = max_templates
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        namespace: str,
+        intent: str,
+        sport: str,
+        player_name: str,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Instantiate a cached plan for a player.
+
+        Args:
+            namespace: Template scope (user ID); templates are never shared across users
+            intent: Request intent
+            sport: Sport named in the request
+            player_name: Player to fill into the template
+
+        Returns:
+            Plan steps for the player, or None on miss
+        """
+        key = (namespace, intent, sport.lower())
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+        if template is None:
+            return None
+        return _replace_in_steps(template, PLAYER_PLACEHOLDER, player_name)
+
+    def put(
+        self,
+        namespace: str,
+        intent: str,
+        sport: Optional[str],
+        player_name: str,
+        steps: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Store a generated plan as a template for its intent and sport.
+
+        Plans without a sport, whose queries never mention the player, or
+        that mention the player other than by full name, are not stored,
+        since they cannot be cleanly re-targeted at another player.
+
+        Args:
+            namespace: Template scope (user ID)
+            intent: Request intent classified from the message
+            sport: Sport the planner LLM determined for the plan
+            player_name: Player the plan was generated for
+            steps: Plan steps with action, description and query
+        """
+        if not sport or not player_name:
+            return
+        if not any(player_name in (step.get("query") or "") for step in steps):
+            return
+
+        template = _replace_in_steps(steps, player_name, PLAYER_PLACEHOLDER)
+        # Partial mentions (e.g. surname only) would leak into other players' plans
+        surname = player_name.split()[-1]
+        if any(surname in (step.get(field) or "") for step in template for field in _TEMPLATE_FIELDS):
+            return
+        key = (namespace, intent, sport.lower())
+
+        with self._lock:
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > self._max_templates:
+                self._templates.popitem(last=False)
+        logger.debug(f"[PLAN_TEMPLATES] Stored template for intent={intent} sport={sport}")
+
+
+plan_templates = PlanTemplateCache()
@@ -61,6 +61,8 @@ class AgentState(TypedDict):
 
     # Accumulated context from tools
     rag_context: str
+    source_doc_ids: List[str]  # Unique document IDs behind rag_context, updated per search
+    seen_chunk_ids: List[str]  # Chunk IDs already in rag_context, skipped by later searches
     player_data: Optional[Dict[str, Any]]
 
     # Composed report data (from compose_report_node)
@@ -71,6 +73,7 @@ class AgentState(TypedDict):
     needs_user_approval: bool
     approval_type: Optional[str]  # "save_player" | "plan_approval" | None
     approval_payload: Optional[Dict[str, Any]]
+    approval_rejected: bool  # Set when the user rejects a HITL request; ends the run
 
     # Output
     final_response: Optional[str]
@@ -242,12 +245,15 @@ def create_initial_state(
         "max_tokens": max_tokens,
         "tasks": [],
         "rag_context": "",
+        "source_doc_ids": [],
+        "seen_chunk_ids": [],
         "player_data": None,
         "report_text": None,
         "report_summary": None,
         "needs_user_approval": False,
         "approval_type": None,
         "approval_payload": None,
+        "approval_rejected": False,
         "final_response": None,
         # Plan tracking
         "plan": None,
@@ -17,8 +17,10 @@ Pydantic Validation:
 - Tool outputs are validated using Pydantic models for consistency
 """
 
-from typing import Dict, Any
+from concurrent.futures import Future
+from typing import Dict, Any, List, Optional, Set
 from pydantic import ValidationError
+from django.db import IntegrityError, OperationalError
 from langchain_core.tools import tool
 from app.rag.pipelines.query_pipeline import query_rag_batch
 from app.services.scouting_report_service import create_with_player
@@ -125,14 +127,73 @@ TOOLS = [search_documents, save_player_report, list_reports]
 # Tool Implementations (called by tool_node with injected context)
 # =============================================================================
 
-def execute_search_documents(query: str, user_id: int, api_key: str) -> str:
+# search_documents result shaping
+_MAX_EXCERPTS = 5
+_MAX_EXCERPT_CHARS = 500
+
+
+def _chunk_source(chunk: Any) -> str:
+    """Document title for a DocumentChunk, or a placeholder."""
+    document = getattr(chunk, "document", None)
+    return document.title if document else "Unknown source"
+
+
+def _chunk_content(chunk: Any) -> str:
+    """Text content of a DocumentChunk."""
+    content = getattr(chunk, "content", None)
+    return content if content is not None else str(chunk)
+
+
+def retrieve_search_documents(query: str, user_id: int, api_key: str) -> Dict[str, Any]:
+    """
+    Retrieval half of execute_search_documents (embedding + vector query).
+
+    Reads and writes no per-workflow state, so it is safe to run on a worker
+    thread while other searches of the same turn are in flight.
+
+    Args:
+        query: Validated search query
+        user_id: User ID for multi-tenant document filtering
+        api_key: OpenAI API key for embeddings
+
+    Returns:
+        query_rag_batch result for the single query
+    """
+    return query_rag_batch(
+        user_id=user_id,
+        queries=[query],
+        max_chunks=10,
+        api_key=api_key,
+    )
+
+
+def execute_search_documents(
+    query: str,
+    user_id: int,
+    api_key: str,
+    source_doc_ids: Optional[Set[str]] = None,
+    seen_chunk_ids: Optional[Set[str]] = None,
+    prefetched: Optional[Future] = None,
+) -> str:
     """
     Execute RAG search on user's documents.
 
+    Excerpts already returned by an earlier search (seen_chunk_ids) and
+    repeated boilerplate within one result are skipped, so the same text is
+    not carried into rag_context (and the composer prompt) twice.
+
     Args:
         query: Search query string
         user_id: User ID for multi-tenant document filtering
         api_key: OpenAI API key for embeddings
+        source_doc_ids: Optional set updated in place with the document IDs
+            of retrieved chunks (tracks report sources across searches)
+        seen_chunk_ids: Optional set of chunk IDs already returned in this
+            workflow; updated in place with the excerpts returned now
+        prefetched: Optional future resolving to this query's
+            retrieve_search_documents result, started concurrently by
+            tool_node. Filtering against seen_chunk_ids and the set updates
+            still happen here, on the caller's thread, in call order.
 
     Returns:
         Formatted search results with source citations
@@ -151,14 +212,15 @@ def execute_search_documents(query: str, user_id: int, api_key: str) -> str:
     logger.info(f"[TOOL] search_documents: query={query[:50]}... user_id={user_id}")
 
     try:
-        result = query_rag_batch(
-            user_id=user_id,
-            queries=[query],
-            max_chunks=10,
-            api_key=api_key,
-        )
+        if prefetched is not None:
+            result = prefetched.result()
+        else:
+            result = retrieve_search_documents(query, user_id, api_key)
 
         chunks = result.get("chunks", [])
+        if source_doc_ids is not None and chunks:
+            source_doc_ids.update(result["columns"]["doc_ids"])
+
         if not chunks:
             output = SearchDocumentsOutput(
                 results="No relevant documents found for this query.",
@@ -166,19 +228,41 @@ def execute_search_documents(query: str, user_id: int, api_key: str) -> str:
             )
             return output.results
 
-        # Format results - chunks is a list of (DocumentChunk, score) tuples
-        formatted = []
-        for chunk, score in chunks[:5]:
-            # DocumentChunk has .content and .document.title
-            source = chunk.document.title if hasattr(chunk, "document") and chunk.document else "Unknown source"
-            content = chunk.content if hasattr(chunk, "content") else str(chunk)
-            content = content[:500] if len(content) > 500 else content
-            formatted.append(f"**[{source}]**\n{content}")
+        # Pick the best-scoring unseen, non-duplicate excerpts
+        # (chunks is a list of (DocumentChunk, score) tuples, sorted by score)
+        columns = result["columns"]
+        seen_texts = set()
+        top_chunks = []
+        for (chunk, _score), chunk_id, text in zip(chunks, columns["chunk_ids"], columns["texts"]):
+            if seen_chunk_ids is not None and chunk_id in seen_chunk_ids:
+                continue
+            # Key on the whole whitespace-normalized text: chunks that only
+            # share an opening (same header or template) are distinct excerpts
+            text_key = hash(" ".join(text.split()))
+            if text_key in seen_texts:
+                continue
+            seen_texts.add(text_key)
+            top_chunks.append((chunk, chunk_id))
+            if len(top_chunks) == _MAX_EXCERPTS:
+                break
+
+        if not top_chunks:
+            logger.info(f"[TOOL] search_documents: all {len(chunks)} chunks already returned by earlier searches")
+            return "All relevant excerpts for this query were already returned by earlier searches."
+
+        if seen_chunk_ids is not None:
+            seen_chunk_ids.update(chunk_id for _chunk, chunk_id in top_chunks)
+
+        # Format results
+        results = "\n\n---\n\n".join(
+            f"**[{_chunk_source(chunk)}]**\n{_chunk_content(chunk)[:_MAX_EXCERPT_CHARS]}"
+            for chunk, _chunk_id in top_chunks
+        )
 
-        logger.info(f"[TOOL] search_documents: found {len(chunks)} chunks, returning top {len(formatted)}")
+        logger.info(f"[TOOL] search_documents: found {len(chunks)} chunks, returning top {len(top_chunks)}")
 
         output = SearchDocumentsOutput(
-            results="\n\n---\n\n".join(formatted),
+            results=results,
             chunk_count=len(chunks)
         )
         return output.results
@@ -196,6 +280,8 @@ def execute_save_player_report(
     player_data: dict,
     report_text: str,
     user_id: int,
+    source_doc_ids: Optional[List[str]] = None,
+    run_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Save player and scouting report to database.
@@ -207,6 +293,10 @@ def execute_save_player_report(
         player_data: Dict with player fields (display_name, position, team, etc.)
         report_text: Full report text content
         user_id: Owner user ID
+        source_doc_ids: Optional IDs of documents the report was built from
+        run_id: Optional idempotency key; a repeated save with the same run_id
+            (on any worker, checked in the database) returns the report
+            created by the first one
 
     Returns:
         Dict with success status, player_id, and report_id
@@ -235,21 +325,10 @@ def execute_save_player_report(
         if "display_name" not in player_data:
             player_data["display_name"] = player_name
 
-        # Validate player data with Pydantic (non-strict, allows extra fields)
+        # Validate player data with Pydantic in one pass over the dict
+        # (non-strict, extra fields such as nested physical/scouting are ignored)
         try:
-            validated_player = PlayerData(
-                display_name=player_data.get("display_name", player_name),
-                position=player_data.get("position"),
-                team=player_data.get("team"),
-                nationality=player_data.get("nationality"),
-                age=player_data.get("age"),
-                height=player_data.get("height"),
-                weight=player_data.get("weight"),
-                preferred_foot=player_data.get("preferred_foot"),
-                strengths=player_data.get("strengths"),
-                weaknesses=player_data.get("weaknesses"),
-                market_value=player_data.get("market_value"),
-            )
+            validated_player = PlayerData.model_validate(player_data)
             # Update player_data with validated/cleaned values
             player_data["display_name"] = validated_player.display_name
         except ValidationError as e:
@@ -261,13 +340,16 @@ def execute_save_player_report(
         report_data = {
             "report_text": report_text,
             "report_summary": [report_text[:200]] if report_text else [],
+            "source_doc_ids": source_doc_ids or None,
         }
 
-        # create_with_player returns (Player, ScoutingReport) tuple
+        # create_with_player returns (Player, ScoutingReport) tuple; for a
+        # run_id that was already saved it returns the existing pair
         player, report = create_with_player(
             owner_id=user_id,
             player_fields=player_data,
             report_data=report_data,
+            run_id=run_id,
         )
 
         logger.info(f"[TOOL] save_player_report: created player_id={player.id} report_id={report.id}")
@@ -287,6 +369,20 @@ def execute_save_player_report(
             success=False,
             error=f"Output validation error: {str(e)}"
         ).model_dump()
+    except IntegrityError as e:
+        # Bad or conflicting player data; a traceback adds nothing here
+        logger.warning(f"[TOOL] save_player_report integrity error: {e}")
+        return SavePlayerReportOutput(
+            success=False,
+            error=f"Could not save report: {str(e)}"
+        ).model_dump()
+    except OperationalError as e:
+        # Transient database failure (connection dropped, lock timeout); safe to retry
+        logger.warning(f"[TOOL] save_player_report database unavailable: {e}")
+        return SavePlayerReportOutput(
+            success=False,
+            error=f"Database temporarily unavailable, please try again: {str(e)}"
+        ).model_dump()
     except Exception as e:
         logger.error(f"[TOOL] save_player_report error: {e}", exc_info=True)
         return SavePlayerReportOutput(
@@ -357,19 +453,23 @@ def execute_list_reports(player_name: str = None, user_id: int = None) -> str:
             }
             player_list.append(player_info)
 
-        # Build response message
+        # Build response message in a single join
         if player_name:
-            message = f"Found {len(player_list)} existing report(s) matching '{player_name}':\n\n"
+            header = f"Found {len(player_list)} existing report(s) matching '{player_name}':\n\n"
+            footer = "\nA report for this player already exists. Ask the user if they want to create a new report anyway or view the existing one."
         else:
-            message = f"Found {len(player_list)} recent scouting report(s):\n\n"
-
-        for p in player_list:
-            positions_str = ", ".join(p["positions"]) if p["positions"] else "Unknown"
-            teams_str = ", ".join(p["teams"]) if p["teams"] else "Unknown"
-            message += f"• **{p['name']}** ({p['sport']}) - {positions_str} - {teams_str} (saved: {p['created_at']})\n"
-
-        if player_name:
-            message += f"\nA report for this player already exists. Ask the user if they want to create a new report anyway or view the existing one."
+            header = f"Found {len(player_list)} recent scouting report(s):\n\n"
+            footer = ""
+
+        message = "".join((
+            header,
+            *(
+                f"• **{p['name']}** ({p['sport']}) - {', '.join(p['positions']) or 'Unknown'}"
+                f" - {', '.join(p['teams']) or 'Unknown'} (saved: {p['created_at']})\n"
+                for p in player_list
+            ),
+            footer,
+        ))
 
         output = ListReportsOutput(
             players=player_list,
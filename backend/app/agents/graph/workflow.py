@@ -5,14 +5,15 @@ This module defines the workflow graph and provides functions to run it
 with proper validation using Pydantic models.
 """
 
-from typing import Optional, Union, Dict, Any, AsyncIterator
+from typing import Optional, Union, Dict, Any, AsyncIterator, Tuple
 from pydantic import ValidationError
 from langgraph.graph import StateGraph, START, END
 from langgraph.checkpoint.postgres import PostgresSaver
 from langgraph.types import Command
 from threading import Thread
-from queue import Queue as ThreadQueue, Empty
+from queue import Empty
 
+from .event_queue import EventQueue
 from .state import AgentState, create_initial_state, validate_workflow_input
 from .nodes import agent_node, tool_node, approval_node, planner_node, plan_approval_node, compose_report_node
 from .models import WorkflowInput, ResumePayload, ApprovalType
@@ -20,6 +21,49 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Nodes whose message output can be the final reply of a run. The HITL nodes
+# reply directly when the user rejects, since the run ends without the agent.
+_REPLY_NODES = ("agent", "plan_approval", "approval")
+
+# Upper bound on characters merged into one streamed token event
+TOKEN_COALESCE_MAX_CHARS = 256
+
+
+def _coalesce_tokens(
+    event_queue: EventQueue,
+    event: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """
+    Merge token events already waiting in the queue into a single event.
+
+    Only events that are queued right now are merged, so this never delays
+    a token; it just turns a burst into one Redis publish / SSE frame.
+
+    Args:
+        event_queue: Workflow event queue
+        event: Token event just taken from the queue
+
+    Returns:
+        Tuple of (merged token event, first non-token event taken from the queue or None)
+    """
+    parts = [event["value"]]
+    size = len(event["value"])
+    next_event = None
+    while size < TOKEN_COALESCE_MAX_CHARS:
+        try:
+            queued = event_queue.get_nowait()
+        except Empty:
+            break
+        if queued.get("type") != "token" or "value" not in queued:
+            next_event = queued
+            break
+        parts.append(queued["value"])
+        size += len(queued["value"])
+
+    if len(parts) == 1:
+        return event, next_event
+    return {**event, "value": "".join(parts)}, next_event
+
 
 def route_after_planner(state: AgentState) -> str:
     """Determine next node after planner."""
@@ -49,6 +93,26 @@ def route_after_agent(state: AgentState) -> str:
     return END
 
 
+def route_after_plan_approval(state: AgentState) -> str:
+    """Determine next node after plan approval."""
+
+    # Plan rejected - nothing left to execute, skip the agent LLM call
+    if state.get("approval_rejected"):
+        return END
+
+    return "agent"
+
+
+def route_after_approval(state: AgentState) -> str:
+    """Determine next node after save_player approval."""
+
+    # Save rejected - the approval node already replied, skip the agent LLM call
+    if state.get("approval_rejected"):
+        return END
+
+    return "agent"
+
+
 def route_after_tools(state: AgentState) -> str:
     """Determine next node after tools."""
 
@@ -66,9 +130,9 @@ def create_workflow(checkpointer: Optional[PostgresSaver] = None):
     Flow:
     - START → planner (generates plan for scouting requests)
     - planner → plan_approval (HITL for plan approval) OR agent (skip for simple queries)
-    - plan_approval → agent (execute approved plan)
+    - plan_approval → agent (execute approved plan) OR END (plan rejected)
     - agent → tools → agent (loop until done)
-    - tools → compose_report (when save_player is called) → approval (HITL) → agent
+    - tools → compose_report (when save_player is called) → approval (HITL) → agent OR END (rejected)
     - agent → END
     """
 
@@ -90,8 +154,8 @@ def create_workflow(checkpointer: Optional[PostgresSaver] = None):
     # Planner routes to plan_approval (for scouting) or agent (for simple queries)
     graph.add_conditional_edges("planner", route_after_planner)
 
-    # After plan is approved, go to agent to execute
-    graph.add_edge("plan_approval", "agent")
+    # After plan is approved, go to agent to execute (rejected plans end the run)
+    graph.add_conditional_edges("plan_approval", route_after_plan_approval)
 
     # Agent routes to tools, approval, or END
     graph.add_conditional_edges("agent", route_after_agent)
@@ -102,8 +166,8 @@ def create_workflow(checkpointer: Optional[PostgresSaver] = None):
     # After compose_report, go to approval for user confirmation
     graph.add_edge("compose_report", "approval")
 
-    # After save_player approval, back to agent
-    graph.add_edge("approval", "agent")
+    # After save_player approval, back to agent (rejected saves end the run)
+    graph.add_conditional_edges("approval", route_after_approval)
 
     # Compile - nodes use interrupt() directly for HITL pauses
     return graph.compile(
@@ -111,6 +175,11 @@ def create_workflow(checkpointer: Optional[PostgresSaver] = None):
     )
 
 
+# Checkpoints are written in the background while the next step runs, so a
+# checkpoint put never blocks the run. Interrupts (HITL) and the final state
+# are still persisted before stream/invoke returns.
+CHECKPOINT_DURABILITY = "async"
+
 # Singleton workflow instance
 _workflow = None
 _checkpointer = None
@@ -159,7 +228,7 @@ def run_workflow(
                 logger.warning(f"[WORKFLOW] Resume payload validation error: {e}")
                 # Continue anyway, the resume might still work
 
-        return workflow.invoke(request, config)
+        return workflow.invoke(request, config, durability=CHECKPOINT_DURABILITY)
 
     # Validate and create initial state
     try:
@@ -185,12 +254,15 @@ def run_workflow(
             "api_key": request.get("api_key", ""),
             "tasks": [],
             "rag_context": "",
+            "source_doc_ids": [],
+            "seen_chunk_ids": [],
             "player_data": None,
             "report_text": None,
             "report_summary": None,
             "needs_user_approval": False,
             "approval_type": None,
             "approval_payload": None,
+            "approval_rejected": False,
             "final_response": None,
             # Plan tracking
             "plan": None,
@@ -200,7 +272,7 @@ def run_workflow(
             "sport_guess": None,
         }
 
-    return workflow.invoke(initial_state, config)
+    return workflow.invoke(initial_state, config, durability=CHECKPOINT_DURABILITY)
 
 
 async def stategraph_workflow_events(
@@ -267,9 +339,9 @@ async def stategraph_workflow_events(
         "save_player_report": "Preparing to save report...",
     }
 
-    # Create thread-safe queue for events from callbacks
+    # Create lock-free queue for events from callbacks (see event_queue.py)
     MAX_QUEUE_SIZE = 10000
-    event_queue = ThreadQueue(maxsize=MAX_QUEUE_SIZE)
+    event_queue = EventQueue(maxsize=MAX_QUEUE_SIZE)
 
     # Create event callback handler for streaming
     callback_handler = EventCallbackHandler(event_queue, status_messages)
@@ -332,7 +404,7 @@ async def stategraph_workflow_events(
             # Build initial state or use Command for resume
             if isinstance(request, Command):
                 # Resume from interrupt
-                for chunk in workflow.stream(request, config=config):
+                for chunk in workflow.stream(request, config=config, durability=CHECKPOINT_DURABILITY):
                     logger.debug(f"[STATEGRAPH_CHUNK] Resume chunk keys={list(chunk.keys()) if isinstance(chunk, dict) else 'N/A'}")
 
                     if isinstance(chunk, dict) and "__interrupt__" in chunk:
@@ -343,7 +415,7 @@ async def stategraph_workflow_events(
                     # Extract final response from last message
                     if isinstance(chunk, dict):
                         for node_name, node_output in chunk.items():
-                            if node_name == "agent" and isinstance(node_output, dict):
+                            if node_name in _REPLY_NODES and isinstance(node_output, dict):
                                 messages = node_output.get("messages", [])
                                 if messages and not getattr(messages[-1], "tool_calls", None):
                                     # Agent produced final response
@@ -370,12 +442,15 @@ async def stategraph_workflow_events(
                     "max_tokens": max_tokens,
                     "tasks": [],
                     "rag_context": "",
+                    "source_doc_ids": [],
+                    "seen_chunk_ids": [],
                     "player_data": None,
                     "report_text": None,
                     "report_summary": None,
                     "needs_user_approval": False,
                     "approval_type": None,
                     "approval_payload": None,
+                    "approval_rejected": False,
                     "final_response": None,
                     # Plan tracking
                     "plan": None,
@@ -385,7 +460,7 @@ async def stategraph_workflow_events(
                     "sport_guess": None,
                 }
 
-                for chunk in workflow.stream(initial_state, config=config):
+                for chunk in workflow.stream(initial_state, config=config, durability=CHECKPOINT_DURABILITY):
                     logger.debug(f"[STATEGRAPH_CHUNK] Chunk keys={list(chunk.keys()) if isinstance(chunk, dict) else 'N/A'}")
 
                     if isinstance(chunk, dict) and "__interrupt__" in chunk:
@@ -396,7 +471,7 @@ async def stategraph_workflow_events(
                     # Extract final response from agent node output
                     if isinstance(chunk, dict):
                         for node_name, node_output in chunk.items():
-                            if node_name == "agent" and isinstance(node_output, dict):
+                            if node_name in _REPLY_NODES and isinstance(node_output, dict):
                                 messages = node_output.get("messages", [])
                                 if messages and not getattr(messages[-1], "tool_calls", None):
                                     content = messages[-1].content if hasattr(messages[-1], "content") else str(messages[-1])
@@ -420,10 +495,16 @@ async def stategraph_workflow_events(
     timeout_count = 0
     max_timeout = 60000  # 10 minutes (60000 * 0.01s = 600 seconds)
     events_yielded = 0
+    pending_event = None  # Non-token event read ahead while coalescing tokens
 
     while not workflow_done:
         try:
-            event = event_queue.get_nowait()
+            if pending_event is not None:
+                event, pending_event = pending_event, None
+            else:
+                event = event_queue.get_nowait()
+            if event.get("type") == "token" and "value" in event:
+                event, pending_event = _coalesce_tokens(event_queue, event)
             timeout_count = 0  # Reset timeout on event received
             event_type = event.get("type", "unknown")
             events_yielded += 1
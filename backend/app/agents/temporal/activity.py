@@ -726,7 +726,9 @@ async def _run_chat_activity_async(
                     api_key_ctx.langfuse_secret_key,
                 )
                 if langfuse_client and hasattr(langfuse_client, "flush"):
-                    langfuse_client.flush()
+                    # flush() blocks on the Langfuse export; keep it off the event loop
+                    # so concurrent activities on this worker keep publishing events
+                    await asyncio.to_thread(langfuse_client.flush)
                     logger.debug(f"[LANGFUSE] Flushed traces for chat_id={chat_id}")
             except Exception as e:
                 logger.warning(f"Failed to flush Langfuse traces: {e}", exc_info=True)
@@ -4,12 +4,15 @@ Agent execution endpoints.
 
 import json
 import os
+import orjson
+import re
 import uuid
 import asyncio
 from django.http import JsonResponse, StreamingHttpResponse
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from pydantic import ValidationError
+from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
 from app.core.dependencies import get_current_user, get_current_user_async
 from app.core.logging import get_logger
 from app.core.redis import get_redis_client
@@ -26,6 +29,16 @@ from app.settings import (
 
 logger = get_logger(__name__)
 
+# Fallback for connection failures surfaced as generic exceptions
+_CONNECTION_ERROR_RE = re.compile(r"connection|disconnected|broken pipe|timeout", re.IGNORECASE)
+
+
+def _is_connection_error(exc: Exception) -> bool:
+    """Check whether a Redis listener error warrants a reconnect."""
+    if isinstance(exc, (RedisConnectionError, RedisTimeoutError, ConnectionError, TimeoutError)):
+        return True
+    return _CONNECTION_ERROR_RE.search(str(exc)) is not None
+
 
 def _format_sse_event(event: dict) -> str:
     """Format event dict as SSE data line."""
@@ -71,7 +84,8 @@ def _format_sse_event(event: dict) -> str:
             elif hasattr(response, "dict"):  # Pydantic v1
                 event["response"] = response.dict()
 
-    return f"data: {json.dumps(event, default=str)}\n\n"
+    payload = orjson.dumps(event, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return f"data: {payload}\n\n"
 
 
 @csrf_exempt
@@ -399,9 +413,7 @@ async def stream_agent(request):
                                         # Process actual messages
                                         if msg["type"] == "message":
                                             try:
-                                                event_data = json.loads(
-                                                    msg["data"].decode("utf-8")
-                                                )
+                                                event_data = orjson.loads(msg["data"])
                                                 yield _format_sse_event(event_data)
                                                 event_type = event_data.get("type")
 
@@ -420,7 +432,7 @@ async def stream_agent(request):
                                                 ]:
                                                     # Close connection on final/error/done
                                                     break
-                                            except json.JSONDecodeError as e:
+                                            except orjson.JSONDecodeError as e:
                                                 logger.warning(
                                                     f"Failed to decode Redis message: {e}"
                                                 )
@@ -446,16 +458,7 @@ async def stream_agent(request):
 
                                 except Exception as e:
                                     # Handle connection errors - check if reconnection is warranted
-                                    error_str = str(e).lower()
-                                    is_connection_error = any(
-                                        phrase in error_str
-                                        for phrase in [
-                                            "connection",
-                                            "disconnected",
-                                            "broken pipe",
-                                            "timeout",
-                                        ]
-                                    )
+                                    is_connection_error = _is_connection_error(e)
 
                                     if (
                                         is_connection_error
@@ -1216,7 +1219,7 @@ async def stream_resume(request):
                 # Process messages
                 if msg["type"] == "message":
                     try:
-                        event_data = json.loads(msg["data"].decode("utf-8"))
+                        event_data = orjson.loads(msg["data"])
                         yield _format_sse_event(event_data)
                         event_type = event_data.get("type")
 
@@ -1226,7 +1229,7 @@ async def stream_resume(request):
                                 f"[STREAM_RESUME] Closing stream on {event_type} event for session={chat_session_id}"
                             )
                             break
-                    except json.JSONDecodeError:
+                    except orjson.JSONDecodeError:
                         continue
                     except Exception as e:
                         logger.error(f"[STREAM_RESUME] Error processing message: {e}")
@@ -2,6 +2,7 @@
 Pydantic schemas for API request validation.
 """
 import re
+import orjson
 from pydantic import BaseModel, Field, validator
 from typing import Optional, List, Dict, Any
 
@@ -76,8 +77,7 @@ class ToolApprovalRequest(BaseModel):
         """Validate tool arguments."""
         if v is not None:
             # Limit args size
-            import json
-            args_size = len(json.dumps(v, default=str))
+            args_size = len(orjson.dumps(v, default=str))
             if args_size > 10000:  # 10KB limit
                 raise ValueError(f"Tool args too large: {args_size} bytes")
         return v
@@ -0,0 +1,53 @@
+"""
+Shared HTTP client for OpenAI API calls.
+
+All LLM clients in a process share one pooled httpx client, so concurrent
+planner, agent and composer calls reuse open HTTP/2 connections instead of
+paying a TCP/TLS handshake per client. The client is created lazily on first
+use and closed at interpreter exit.
+"""
+import atexit
+import threading
+from typing import Optional
+
+import httpx
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_OPENAI_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_OPENAI_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=10.0)
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def get_openai_http_client() -> httpx.Client:
+    """
+    Get the process-wide httpx client for OpenAI requests.
+
+    Returns:
+        Shared httpx.Client with HTTP/2 and connection pooling enabled
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    http2=True,
+                    limits=_OPENAI_HTTP_LIMITS,
+                    timeout=_OPENAI_HTTP_TIMEOUT,
+                )
+                atexit.register(close_openai_http_client)
+                logger.info("[HTTP] Created shared OpenAI HTTP client")
+    return _client
+
+
+def close_openai_http_client() -> None:
+    """Close the shared OpenAI HTTP client, if it was created."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
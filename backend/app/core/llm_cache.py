@@ -0,0 +1,102 @@
+"""
+Response cache for deterministic LLM calls.
+
+Calls made with temperature=0 are a pure function of (model, messages), so
+repeated requests (re-runs on the same player, dev iteration) can reuse the
+previous completion instead of paying full LLM latency and cost.
+
+Entries live in Redis with a TTL so they are shared across API and Temporal
+worker processes. Graph nodes run in worker threads, so this module uses the
+synchronous Redis client. Any Redis failure is treated as a cache miss.
+"""
+import hashlib
+import threading
+from typing import Optional, Sequence
+
+import orjson
+import redis
+from langchain_core.messages import BaseMessage
+
+from app.settings import REDIS_URL, REDIS_PASSWORD, LLM_CACHE_ENABLED, LLM_CACHE_TTL_SECONDS
+from app.core.logging import get_logger
+from app.core.redis import _url_with_password
+
+logger = get_logger(__name__)
+
+_KEY_PREFIX = "llm_cache:"
+
+
+class LLMCache:
+    """Redis-backed cache of LLM completions keyed by sha256(model + messages)."""
+
+    def __init__(self, ttl_seconds: int = LLM_CACHE_TTL_SECONDS, enabled: bool = LLM_CACHE_ENABLED):
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._client: Optional[redis.Redis] = None
+        self._lock = threading.Lock()
+
+    def _get_client(self) -> redis.Redis:
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = redis.Redis.from_url(
+                        _url_with_password(REDIS_URL, REDIS_PASSWORD),
+                        decode_responses=True,
+                        socket_timeout=1.0,
+                        socket_connect_timeout=1.0,
+                    )
+        return self._client
+
+    def cache_key(
+        self,
+        model: str,
+        messages: Sequence[BaseMessage],
+        temperature: float,
+        namespace: str = "",
+    ) -> Optional[str]:
+        """
+        Build a cache key for an LLM call.
+
+        Args:
+            model: Model name
+            messages: Messages sent to the model
+            temperature: Sampling temperature (non-deterministic calls are not cached)
+            namespace: Optional scope (e.g. user ID) so entries are never shared across tenants
+
+        Returns:
+            Cache key, or None if the call should not be cached
+        """
+        if not self.enabled or temperature > 0:
+            return None
+        payload = orjson.dumps(
+            {
+                "namespace": namespace,
+                "model": model,
+                "messages": [[m.type, m.content] for m in messages],
+            },
+            option=orjson.OPT_SORT_KEYS,
+            default=str,
+        )
+        return _KEY_PREFIX + hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: Optional[str]) -> Optional[str]:
+        """Return the cached completion for key, or None on miss/error."""
+        if key is None:
+            return None
+        try:
+            return self._get_client().get(key)
+        except redis.RedisError as e:
+            logger.warning(f"[LLM_CACHE] Get failed, treating as miss: {e}")
+            return None
+
+    def set(self, key: Optional[str], content: str) -> None:
+        """Store a completion under key with the configured TTL."""
+        if key is None or not content:
+            return
+        try:
+            self._get_client().set(key, content, ex=self.ttl_seconds)
+        except redis.RedisError as e:
+            logger.warning(f"[LLM_CACHE] Set failed: {e}")
+
+
+llm_cache = LLMCache()
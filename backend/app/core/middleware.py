@@ -3,8 +3,12 @@ Middleware for request-level concurrency limiting and other cross-cutting concer
 """
 import asyncio
 import os
-from typing import Callable
+import zlib
+from typing import AsyncIterator, Callable, Iterable, Iterator
+from asgiref.sync import iscoroutinefunction
 from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.decorators import sync_and_async_middleware
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -51,3 +55,82 @@ def concurrency_middleware(get_response: Callable) -> Callable:
             return await get_response(request)
     
     return middleware
+
+
+def _new_gzip_compressor():
+    # wbits=31 selects the gzip container (header + CRC trailer)
+    return zlib.compressobj(6, zlib.DEFLATED, 31)
+
+
+def _gzip_event_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Gzip a sync SSE stream, sync-flushing after every event."""
+    compressor = _new_gzip_compressor()
+    for chunk in chunks:
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+async def _agzip_event_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Gzip an async SSE stream, sync-flushing after every event."""
+    compressor = _new_gzip_compressor()
+    async for chunk in chunks:
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+def _compress_event_stream(request: HttpRequest, response: HttpResponse) -> HttpResponse:
+    """Gzip text/event-stream responses when the client accepts it."""
+    if (
+        not getattr(response, "streaming", False)
+        or not response.get("Content-Type", "").startswith("text/event-stream")
+        or response.has_header("Content-Encoding")
+    ):
+        return response
+
+    patch_vary_headers(response, ("Accept-Encoding",))
+    if "gzip" not in request.META.get("HTTP_ACCEPT_ENCODING", ""):
+        return response
+
+    if response.is_async:
+        response.streaming_content = _agzip_event_stream(response.streaming_content)
+    else:
+        response.streaming_content = _gzip_event_stream(response.streaming_content)
+    response["Content-Encoding"] = "gzip"
+    return response
+
+
+@sync_and_async_middleware
+def event_stream_gzip_middleware(get_response: Callable) -> Callable:
+    """
+    Middleware to gzip Server-Sent Events streams.
+
+    Token streams are highly repetitive JSON (`data: {"type": "token", ...}`)
+    and compress well. Django's GZipMiddleware is not used because it would
+    also compress every JSON API response (BREACH exposure for responses that
+    carry tokens) and does not flush per event. Here only text/event-stream
+    responses are compressed, with a Z_SYNC_FLUSH after each chunk so every
+    event reaches the client immediately.
+
+    Usage in settings.py:
+        MIDDLEWARE = [
+            'django.middleware.security.SecurityMiddleware',
+            'app.core.middleware.event_stream_gzip_middleware',
+            ...
+        ]
+
+    Args:
+        get_response: Django's get_response callable (sync or async)
+
+    Returns:
+        Middleware function matching get_response's sync/async mode
+    """
+    if iscoroutinefunction(get_response):
+        async def middleware(request: HttpRequest) -> HttpResponse:
+            response = await get_response(request)
+            return _compress_event_stream(request, response)
+    else:
+        def middleware(request: HttpRequest) -> HttpResponse:
+            response = get_response(request)
+            return _compress_event_stream(request, response)
+
+    return middleware
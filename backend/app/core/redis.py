@@ -11,6 +11,7 @@ from urllib.parse import urlparse, urlunparse
 from typing import Optional, Dict, Any, List
 from collections import deque
 
+import orjson
 import redis.asyncio as redis
 from app.settings import REDIS_URL, REDIS_PASSWORD, REDIS_MAX_CONNECTIONS
 from app.core.logging import get_logger
@@ -249,7 +250,7 @@ class RobustRedisPubSub:
 
                 if message and message['type'] == 'message':
                     self._last_message_time = time.time()
-                    data = json.loads(message['data'].decode('utf-8'))
+                    data = orjson.loads(message['data'])
 
                     # Skip internal ping messages
                     if data.get('type') != 'ping':
@@ -316,9 +317,9 @@ class RobustRedisPublisher:
             logger.warning(f"Circuit breaker open for Redis publish, dropping message")
             return False
 
-        # Serialize message
+        # Serialize message (orjson emits bytes directly, no str -> bytes re-encode)
         try:
-            serialized = json.dumps(message, default=str)
+            serialized = orjson.dumps(message, default=str, option=orjson.OPT_NON_STR_KEYS)
         except Exception as e:
             logger.error(f"Failed to serialize message: {e}")
             return False
@@ -497,7 +498,7 @@ class RedisStreamManager:
         """
         # Serialize event
         event_data = {
-            "data": json.dumps(event, default=str),
+            "data": orjson.dumps(event, default=str, option=orjson.OPT_NON_STR_KEYS),
             "timestamp": str(time.time())
         }
         
@@ -542,7 +543,7 @@ class RedisStreamManager:
         events = []
         for stream_name, messages in result:
             for message_id, fields in messages:
-                event = json.loads(fields[b"data"].decode())
+                event = orjson.loads(fields[b"data"])
                 events.append({
                     "id": message_id.decode() if isinstance(message_id, bytes) else message_id,
                     "event": event
@@ -616,7 +617,7 @@ class RedisStreamManager:
         events = []
         for stream_name, messages in result:
             for message_id, fields in messages:
-                event = json.loads(fields[b"data"].decode())
+                event = orjson.loads(fields[b"data"])
                 events.append({
                     "id": message_id.decode() if isinstance(message_id, bytes) else message_id,
                     "event": event
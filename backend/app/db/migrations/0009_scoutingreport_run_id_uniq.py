@@ -0,0 +1,20 @@
+# Generated manually: run_id is the idempotency key for saving a scouting report
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("db", "0008_player_scoutingreport"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="scoutingreport",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("run_id__isnull", False)),
+                fields=("run_id",),
+                name="scouting_reports_run_id_uniq",
+            ),
+        ),
+    ]
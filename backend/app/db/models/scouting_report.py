@@ -22,7 +22,7 @@ class ScoutingReport(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     # Audit/correlation fields
-    run_id = models.CharField(max_length=255, null=True, blank=True)  # workflow/run correlation
+    run_id = models.CharField(max_length=255, null=True, blank=True)  # workflow/run correlation + idempotency key
     request_text = models.TextField(null=True, blank=True)  # original user request
 
     # Report content
@@ -42,6 +42,14 @@ class ScoutingReport(models.Model):
             models.Index(fields=['player', 'created_at'], name='scouting_reports_player_idx'),
             models.Index(fields=['created_at'], name='scouting_reports_created_idx'),
         ]
+        constraints = [
+            # A run_id identifies one save; retries must not create a second report
+            models.UniqueConstraint(
+                fields=['run_id'],
+                condition=models.Q(run_id__isnull=False),
+                name='scouting_reports_run_id_uniq',
+            ),
+        ]
 
     def __str__(self):
         return f"Report for {self.player.display_name} ({self.created_at})"
@@ -7,7 +7,8 @@ Reference: https://python.reference.langfuse.com/langfuse
 
 import threading
 import time
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 from langfuse.langchain import CallbackHandler
 from app.core.config import (
     LANGFUSE_BASE_URL,
@@ -20,6 +21,10 @@ logger = get_logger(__name__)
 # Thread-safe cache for Langfuse clients (keyed by public_key)
 _user_langfuse_clients: Dict[str, Any] = {}
 _user_callback_handlers: Dict[str, CallbackHandler] = {}
+# Trace-bound handlers keyed by (public_key, trace_id): every node of a run
+# shares one trace_id, so the handler is built once per run, not per LLM call
+_trace_callback_handlers: "OrderedDict[Tuple[str, str], CallbackHandler]" = OrderedDict()
+_MAX_TRACE_CALLBACK_HANDLERS = 256
 _callback_failure_timestamps: Dict[str, float] = {}
 _client_lock = threading.Lock()
 _CALLBACK_HANDLER_TIMEOUT_SECONDS = 2.0
@@ -83,8 +88,9 @@ def get_callback_handler_for_user(
     Get Langfuse CallbackHandler using cached client.
 
     Reuses the cached Langfuse client to prevent memory leaks. If a trace_id
-    is provided, a new handler is created per trace to ensure correct
-    association with the current trace.
+    is provided, the handler is bound to that trace and cached per
+    (public_key, trace_id) in a bounded LRU, so the nodes of one run share
+    a single handler.
 
     Note: In Langfuse SDK v3, session_id is passed via metadata when invoking
     the LLM, not in the CallbackHandler constructor. Use get_langfuse_metadata()
@@ -97,10 +103,16 @@ def get_callback_handler_for_user(
 
     cache_key = public_key
     use_cache = trace_id is None
+    trace_key = (public_key, trace_id)
 
     with _client_lock:
         if use_cache and cache_key in _user_callback_handlers:
             return _user_callback_handlers[cache_key]
+        if not use_cache:
+            cached = _trace_callback_handlers.get(trace_key)
+            if cached is not None:
+                _trace_callback_handlers.move_to_end(trace_key)
+                return cached
 
         last_failure = _callback_failure_timestamps.get(cache_key)
         if last_failure and (time.time() - last_failure) < _CALLBACK_FAILURE_TTL_SECONDS:
@@ -158,6 +170,14 @@ def get_callback_handler_for_user(
             logger.debug(
                 f"Created and cached CallbackHandler for key: {cache_key[:8]}..."
             )
+        else:
+            with _client_lock:
+                existing = _trace_callback_handlers.get(trace_key)
+                if existing:
+                    return existing
+                _trace_callback_handlers[trace_key] = handler
+                while len(_trace_callback_handlers) > _MAX_TRACE_CALLBACK_HANDLERS:
+                    _trace_callback_handlers.popitem(last=False)
 
         return handler
     except Exception as e:
@@ -183,6 +203,8 @@ def cleanup_user_client(public_key: str):
                 logger.warning(f"Error during client cleanup: {e}")
 
         _user_callback_handlers.pop(public_key, None)
+        for trace_key in [k for k in _trace_callback_handlers if k[0] == public_key]:
+            del _trace_callback_handlers[trace_key]
 
 
 def cleanup_all_clients():
@@ -202,6 +224,7 @@ def cleanup_all_clients():
 
         _user_langfuse_clients.clear()
         _user_callback_handlers.clear()
+        _trace_callback_handlers.clear()
 
 
 def get_langfuse_metadata(
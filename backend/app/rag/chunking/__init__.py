@@ -4,7 +4,13 @@ Document chunking strategies.
 from .base import ChunkingConfig, Chunk, ChunkingStrategyBase
 from .recursive import RecursiveCharacterTextSplitter
 from .semantic import SemanticTextSplitter
-from .tokenizer import count_tokens, get_tokenizer, estimate_chunk_size_in_chars
+from .tokenizer import (
+    count_tokens,
+    count_tokens_batch,
+    fit_to_token_budget,
+    get_tokenizer,
+    estimate_chunk_size_in_chars,
+)
 
 __all__ = [
     'ChunkingConfig', 
@@ -13,6 +19,8 @@ __all__ = [
     'RecursiveCharacterTextSplitter',
     'SemanticTextSplitter',
     'count_tokens',
+    'count_tokens_batch',
+    'fit_to_token_budget',
     'get_tokenizer',
     'estimate_chunk_size_in_chars'
 ]
@@ -1,7 +1,7 @@
 """
 Token counting utilities using tiktoken for accurate token estimation.
 """
-from typing import Optional
+from typing import List, Optional
 from django.conf import settings
 from app.core.logging import get_logger
 
@@ -74,6 +74,74 @@ def count_tokens(text: str, model_name: Optional[str] = None) -> int:
     return len(text) // 4
 
 
+def count_tokens_batch(texts: List[str], model_name: Optional[str] = None) -> int:
+    """
+    Count total tokens across many texts with a single tiktoken call.
+
+    Uses encode_batch so the BPE runs once in Rust for all texts instead of
+    paying the per-call overhead of count_tokens in a Python loop.
+
+    Args:
+        texts: Texts to count tokens for
+        model_name: Model name for tokenizer selection
+
+    Returns:
+        Total number of tokens across all texts
+    """
+    if not texts:
+        return 0
+
+    tokenizer = get_tokenizer(model_name)
+
+    if tokenizer is not None:
+        try:
+            return sum(len(tokens) for tokens in tokenizer.encode_batch(texts))
+        except Exception as e:
+            logger.warning(f"Batch token counting failed: {e}, using estimation")
+
+    # Fallback: rough estimation (1 token ≈ 4 characters)
+    return sum(len(text) // 4 for text in texts)
+
+
+def fit_to_token_budget(texts: List[str], budget: int, model_name: Optional[str] = None) -> List[str]:
+    """
+    Return the longest prefix of texts whose total token count fits the budget.
+
+    Tokenizes all texts in one encode_batch call, then accumulates in order,
+    so callers keep their highest-priority items first.
+
+    Args:
+        texts: Texts in priority order
+        budget: Maximum total tokens
+        model_name: Model name for tokenizer selection
+
+    Returns:
+        Prefix of texts that fits within the budget
+    """
+    if not texts:
+        return []
+
+    tokenizer = get_tokenizer(model_name)
+    token_counts = None
+
+    if tokenizer is not None:
+        try:
+            token_counts = [len(tokens) for tokens in tokenizer.encode_batch(texts)]
+        except Exception as e:
+            logger.warning(f"Batch token counting failed: {e}, using estimation")
+
+    if token_counts is None:
+        # Fallback: rough estimation (1 token ≈ 4 characters)
+        token_counts = [len(text) // 4 for text in texts]
+
+    total = 0
+    for index, tokens in enumerate(token_counts):
+        total += tokens
+        if total > budget:
+            return texts[:index]
+    return texts
+
+
 def estimate_chunk_size_in_chars(target_tokens: int, model_name: Optional[str] = None) -> int:
     """
     Estimate character count for a target token count.
@@ -4,5 +4,11 @@ Embedding client implementations.
 
 from .client_base import EmbeddingsClientBase
 from .openai_client import OpenAIEmbeddingsClient
+from .query_cache import QueryEmbeddingCache, query_embedding_cache
 
-__all__ = ["EmbeddingsClientBase", "OpenAIEmbeddingsClient"]
+__all__ = [
+    "EmbeddingsClientBase",
+    "OpenAIEmbeddingsClient",
+    "QueryEmbeddingCache",
+    "query_embedding_cache",
+]
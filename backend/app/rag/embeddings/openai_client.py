@@ -5,10 +5,43 @@ OpenAI embedding client implementation with async support.
 import os
 import time
 import asyncio
+import threading
+from functools import lru_cache
 from typing import List
 from django.conf import settings
 from langchain_openai import OpenAIEmbeddings
 from .client_base import EmbeddingsClientBase
+from .query_cache import query_embedding_cache
+from app.settings import RAG_EMBEDDING_MAX_CONCURRENCY
+from app.core.http import get_openai_http_client
+
+# Process-wide cap on in-flight sync embedding requests. Clients are created
+# per call, so a per-instance limit would not bound bursts across requests;
+# rate-limit retries (which honor Retry-After) are left to the OpenAI SDK.
+_EMBEDDING_REQUEST_SLOTS = threading.BoundedSemaphore(RAG_EMBEDDING_MAX_CONCURRENCY)
+
+
+@lru_cache(maxsize=32)
+def _get_langchain_embeddings(model_name: str, api_key: str) -> OpenAIEmbeddings:
+    """
+    Get a cached LangChain embeddings client for the given model and key.
+
+    OpenAIEmbeddingsClient is created per search, so without this every
+    query paid for a new OpenAI client and a fresh TLS handshake. Sync
+    requests go through the process-wide pooled HTTP/2 client.
+
+    Args:
+        model_name: Embedding model name
+        api_key: OpenAI API key
+
+    Returns:
+        Shared OpenAIEmbeddings instance
+    """
+    return OpenAIEmbeddings(
+        model=model_name,
+        openai_api_key=api_key,
+        http_client=get_openai_http_client(),
+    )
 
 
 class OpenAIEmbeddingsClient(EmbeddingsClientBase):
@@ -31,10 +64,8 @@ class OpenAIEmbeddingsClient(EmbeddingsClientBase):
         if not self._api_key:
             raise ValueError("OpenAI API key is required")
 
-        # Initialize LangChain embeddings
-        self._embeddings = OpenAIEmbeddings(
-            model=self._model_name, openai_api_key=self._api_key
-        )
+        # Shared LangChain embeddings (connection pool stays warm across calls)
+        self._embeddings = _get_langchain_embeddings(self._model_name, self._api_key)
 
         # Get dimensions from model (common values)
         self._dimensions = getattr(settings, "RAG_EMBEDDING_DIMENSIONS", 1536)
@@ -82,7 +113,8 @@ class OpenAIEmbeddingsClient(EmbeddingsClientBase):
             max_retries = 3
             for attempt in range(max_retries):
                 try:
-                    batch_embeddings = self._embeddings.embed_documents(batch)
+                    with _EMBEDDING_REQUEST_SLOTS:
+                        batch_embeddings = self._embeddings.embed_documents(batch)
                     all_embeddings.extend(batch_embeddings)
 
                     # Estimate tokens: OpenAI embeddings charge ~1 token per 4 characters
@@ -120,7 +152,14 @@ class OpenAIEmbeddingsClient(EmbeddingsClientBase):
         Returns:
             Embedding vector
         """
-        embedding = self._embeddings.embed_query(text)
+        # Repeated queries (plan re-runs, retries) skip the API round-trip
+        embedding = query_embedding_cache.get(user_id, self._model_name, text)
+        if embedding is not None:
+            return embedding
+
+        with _EMBEDDING_REQUEST_SLOTS:
+            embedding = self._embeddings.embed_query(text)
+        query_embedding_cache.put(user_id, self._model_name, text, embedding)
 
         # Estimate tokens: OpenAI embeddings charge ~1 token per 4 characters
         # This is an approximation since OpenAI doesn't return exact token counts
@@ -134,6 +173,31 @@ class OpenAIEmbeddingsClient(EmbeddingsClientBase):
 
         return embedding
 
+    def embed_queries(self, texts: List[str], user_id: int = None) -> List[List[float]]:
+        """
+        Embed several query texts in one API request.
+
+        Cached query vectors are reused; only the misses are sent, as a
+        single batched embeddings call instead of one request per query.
+
+        Args:
+            texts: Query texts to embed
+            user_id: Optional user ID for token usage tracking
+
+        Returns:
+            Embedding vectors, in the same order as texts
+        """
+        embeddings = [query_embedding_cache.get(user_id, self._model_name, text) for text in texts]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+
+        if missing:
+            fresh = self.embed_texts([texts[i] for i in missing], user_id=user_id)
+            for i, embedding in zip(missing, fresh):
+                embeddings[i] = embedding
+                query_embedding_cache.put(user_id, self._model_name, texts[i], embedding)
+
+        return embeddings
+
     async def aembed_texts(
         self, texts: List[str], user_id: int = None
     ) -> List[List[float]]:
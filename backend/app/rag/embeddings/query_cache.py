@@ -0,0 +1,111 @@
+"""
+In-process cache of query embeddings.
+
+Search queries repeat across turns and workflow retries (the same plan steps
+re-run, the agent re-issues a query), and each repeat would otherwise pay a
+full OpenAI embedding round-trip before the vector search. A query embedding
+depends only on the model and the text, so it is cached here with an LRU
+bound and a TTL.
+
+Entries are scoped per user so one tenant's queries are never served from
+another's cache. Embeddings do not depend on the indexed documents, so
+document uploads and deletes need no invalidation.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from app.settings import (
+    RAG_QUERY_EMBEDDING_CACHE_SIZE,
+    RAG_QUERY_EMBEDDING_CACHE_TTL_SECONDS,
+)
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_CacheKey = Tuple[Optional[int], str, str]
+
+
+def _normalize_query(text: str) -> str:
+    """Collapse whitespace so trivially different spellings share an entry."""
+    return " ".join(text.split())
+
+
+class QueryEmbeddingCache:
+    """Thread-safe LRU + TTL cache of query vectors keyed by (user_id, model, query)."""
+
+    def __init__(
+        self,
+        max_size: int = RAG_QUERY_EMBEDDING_CACHE_SIZE,
+        ttl_seconds: int = RAG_QUERY_EMBEDDING_CACHE_TTL_SECONDS,
+    ):
+        self._entries: "OrderedDict[_CacheKey, Tuple[float, List[float]]]" = OrderedDict()
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_size > 0 and self._ttl_seconds > 0
+
+    def get(self, user_id: Optional[int], model: str, query: str) -> Optional[List[float]]:
+        """
+        Look up a cached query embedding.
+
+        Args:
+            user_id: User the query belongs to
+            model: Embedding model name
+            query: Query text
+
+        Returns:
+            Embedding vector, or None on miss or expiry
+        """
+        if not self.enabled:
+            return None
+        key = (user_id, model, _normalize_query(query))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            hits, misses = self.hits, self.misses
+        logger.debug(f"[EMBED_CACHE] Hit for query embedding ({hits} hits / {misses} misses)")
+        return entry[1]
+
+    def put(self, user_id: Optional[int], model: str, query: str, embedding: List[float]) -> None:
+        """
+        Store a query embedding.
+
+        Args:
+            user_id: User the query belongs to
+            model: Embedding model name
+            query: Query text
+            embedding: Embedding vector
+        """
+        if not self.enabled or not embedding:
+            return
+        key = (user_id, model, _normalize_query(query))
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, embedding)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+query_embedding_cache = QueryEmbeddingCache()
@@ -10,6 +10,7 @@ Extended for scouting workflow with:
 
 import time
 import hashlib
+from operator import itemgetter
 from typing import List, Optional, Dict, Any, Tuple, Set
 from django.conf import settings
 import os
@@ -190,6 +191,60 @@ FIELD_KEYWORDS = {
 }
 
 
+def _chunk_doc_id(chunk: Any) -> Any:
+    """Return the document ID of an ORM chunk or chunk-like object."""
+    doc_id = getattr(chunk, "document_id", None)
+    if doc_id is None:
+        doc_id = getattr(chunk, "doc_id", "unknown")
+    return doc_id
+
+
+def _chunk_id(chunk: Any) -> Any:
+    """Return the chunk ID of an ORM chunk or chunk-like object."""
+    chunk_id = getattr(chunk, "id", None)
+    if chunk_id is None:
+        chunk_id = getattr(chunk, "chunk_id", "unknown")
+    return chunk_id
+
+
+def _to_columns(chunks_with_scores: List[Tuple[Any, float]]) -> Dict[str, List[Any]]:
+    """
+    Split (chunk, score) tuples into parallel column lists.
+
+    Downstream consumers (evidence pack, source doc ids) read only one or two
+    fields per chunk, so a single pass here avoids re-walking the chunk
+    objects for every consumer.
+
+    Args:
+        chunks_with_scores: List of (chunk, score) tuples, already ordered
+
+    Returns:
+        Dict with parallel lists: doc_ids, chunk_ids, texts, scores
+    """
+    doc_ids: List[str] = []
+    chunk_ids: List[str] = []
+    texts: List[str] = []
+    scores: List[float] = []
+
+    for chunk, score in chunks_with_scores:
+        doc_ids.append(str(_chunk_doc_id(chunk)))
+        chunk_ids.append(str(_chunk_id(chunk)))
+        texts.append(getattr(chunk, "content", str(chunk)))
+        scores.append(float(score))
+
+    return {
+        "doc_ids": doc_ids,
+        "chunk_ids": chunk_ids,
+        "texts": texts,
+        "scores": scores,
+    }
+
+
+def _text_hash(text: str) -> str:
+    """Short hash of normalized (lowercased, stripped) chunk text."""
+    return hashlib.sha256(text.lower().strip().encode("utf-8")).hexdigest()[:16]
+
+
 def deduplicate_chunks(
     chunks_with_scores: List[Tuple[Any, float]],
     method: str = "doc_chunk_id",
@@ -207,33 +262,24 @@ def deduplicate_chunks(
     Returns:
         Deduplicated list of (chunk, score) tuples, keeping highest score
     """
-    seen: Dict[str, Tuple[Any, float]] = {}
+    seen: Dict[Tuple[Any, ...], Tuple[Any, float]] = {}
 
     for chunk, score in chunks_with_scores:
-        # Generate dedup key based on method
+        # Generate dedup key based on method (tuples: no per-chunk string formatting)
         if method == "text_hash":
-            # Normalize text: lowercase, strip whitespace
-            normalized = chunk.content.lower().strip()
-            key = hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+            key = (_text_hash(chunk.content),)
         elif method == "both":
-            # Use composite key
-            doc_id = getattr(chunk, "document_id", None) or getattr(chunk, "doc_id", "unknown")
-            chunk_id = getattr(chunk, "id", None) or getattr(chunk, "chunk_id", "unknown")
-            normalized = chunk.content.lower().strip()
-            text_hash = hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
-            key = f"{doc_id}:{chunk_id}:{text_hash}"
+            key = (_chunk_doc_id(chunk), _chunk_id(chunk), _text_hash(chunk.content))
         else:  # doc_chunk_id (default)
-            doc_id = getattr(chunk, "document_id", None) or getattr(chunk, "doc_id", "unknown")
-            chunk_id = getattr(chunk, "id", None) or getattr(chunk, "chunk_id", "unknown")
-            key = f"{doc_id}:{chunk_id}"
+            key = (_chunk_doc_id(chunk), _chunk_id(chunk))
 
         # Keep chunk with highest score
-        if key not in seen or score > seen[key][1]:
+        current = seen.get(key)
+        if current is None or score > current[1]:
             seen[key] = (chunk, score)
 
     # Sort by score descending
-    result = sorted(seen.values(), key=lambda x: x[1], reverse=True)
-    return result
+    return sorted(seen.values(), key=itemgetter(1), reverse=True)
 
 
 def calculate_coverage(
@@ -347,12 +393,20 @@ def query_rag_batch(
     all_chunks: List[Tuple[Any, float]] = []
     query_results = {}
 
+    # Embed all queries in one request instead of one round-trip per query
+    try:
+        query_vectors = embeddings_client.embed_queries(queries, user_id=user_id)
+    except Exception as e:
+        logger.warning(f"Query embedding failed for {len(queries)} queries. Error: {e}")
+        query_vectors = [None] * len(queries)
+
     # Execute each query
-    for query in queries:
-        try:
-            # Embed query
-            query_vector = embeddings_client.embed_query(query, user_id=user_id)
+    for query, query_vector in zip(queries, query_vectors):
+        if query_vector is None:
+            query_results[query] = 0
+            continue
 
+        try:
             # Vector search
             chunks_with_scores = vector_store.query(
                 query_vector=query_vector,
@@ -381,6 +435,9 @@ def query_rag_batch(
     chunk_objects = [chunk for chunk, _ in final_chunks]
     coverage_result = calculate_coverage(chunk_objects)
 
+    # Column view of the final chunks (built once, reused by to_evidence_pack)
+    columns = _to_columns(final_chunks)
+
     latency_ms = int((time.time() - start_time) * 1000)
 
     logger.info(
@@ -391,6 +448,7 @@ def query_rag_batch(
 
     return {
         "chunks": final_chunks,
+        "columns": columns,
         "queries": queries,
         "coverage": {
             "found": coverage_result["found"],
@@ -424,26 +482,20 @@ def to_evidence_pack(
         - coverage: Coverage
         - confidence: "low" | "med" | "high"
     """
-    chunks_data = []
-
-    for chunk, score in batch_result.get("chunks", []):
-        # Extract IDs handling both ORM objects and dicts
-        doc_id = getattr(chunk, "document_id", None)
-        if doc_id is None:
-            doc_id = getattr(chunk, "doc_id", "unknown")
-
-        chunk_id = getattr(chunk, "id", None)
-        if chunk_id is None:
-            chunk_id = getattr(chunk, "chunk_id", "unknown")
-
-        text = getattr(chunk, "content", str(chunk))
-
-        chunks_data.append({
-            "doc_id": str(doc_id),
-            "chunk_id": str(chunk_id),
-            "text": text,
-            "score": float(score),
-        })
+    columns = batch_result.get("columns")
+    if columns is None:
+        columns = _to_columns(batch_result.get("chunks", []))
+
+    # Rebuild per-chunk dicts only here, at the EvidencePack boundary
+    chunks_data = [
+        {"doc_id": doc_id, "chunk_id": chunk_id, "text": text, "score": score}
+        for doc_id, chunk_id, text, score in zip(
+            columns["doc_ids"],
+            columns["chunk_ids"],
+            columns["texts"],
+            columns["scores"],
+        )
+    ]
 
     return {
         "queries": batch_result.get("queries", []),
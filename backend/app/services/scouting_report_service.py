@@ -3,7 +3,7 @@ Scouting Report service layer for business logic.
 """
 from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from app.db.models.player import Player
 from app.db.models.scouting_report import ScoutingReport
 from app.services import player_service
@@ -51,6 +51,24 @@ def create_scouting_report(
     return report
 
 
+def get_report_by_run_id(owner_id: int, run_id: str) -> Optional[ScoutingReport]:
+    """
+    Get the scouting report saved under a run_id for an owner.
+
+    Args:
+        owner_id: User ID who owns the player
+        run_id: Idempotency key the report was saved with
+
+    Returns:
+        ScoutingReport (with player loaded) or None if not found
+    """
+    return (
+        ScoutingReport.objects.select_related("player")
+        .filter(run_id=run_id, player__owner_id=owner_id)
+        .first()
+    )
+
+
 def create_with_player(
     owner_id: int,
     player_fields: Dict[str, Any],
@@ -66,11 +84,16 @@ def create_with_player(
     2. Insert scouting_reports row with player_id
     3. Update players.latest_report_id
 
+    run_id doubles as an idempotency key (unique among reports): if a report
+    was already saved under it for this owner, that player and report are
+    returned instead of creating duplicates, including when a concurrent
+    save wins the race on the unique constraint.
+
     Args:
         owner_id: User ID who owns the player
         player_fields: Dict matching PlayerFields schema
         report_data: Dict with report_text, report_summary, coverage, source_doc_ids
-        run_id: Optional workflow run correlation ID
+        run_id: Optional workflow run correlation ID / idempotency key
         request_text: Optional original user request
 
     Returns:
@@ -79,7 +102,32 @@ def create_with_player(
     Raises:
         Exception: If transaction fails (rolls back)
     """
+    try:
+        return _create_with_player(owner_id, player_fields, report_data, run_id, request_text)
+    except IntegrityError:
+        if run_id:
+            existing = get_report_by_run_id(owner_id, run_id)
+            if existing is not None:
+                logger.info(f"Report for run_id={run_id} saved concurrently, reusing report {existing.id}")
+                return existing.player, existing
+        raise
+
+
+def _create_with_player(
+    owner_id: int,
+    player_fields: Dict[str, Any],
+    report_data: Dict[str, Any],
+    run_id: Optional[str],
+    request_text: Optional[str],
+) -> Tuple[Player, ScoutingReport]:
+    """Transactional body of create_with_player."""
     with transaction.atomic():
+        if run_id:
+            existing = get_report_by_run_id(owner_id, run_id)
+            if existing is not None:
+                logger.info(f"Report for run_id={run_id} already saved, reusing report {existing.id}")
+                return existing.player, existing
+
         # 1. Create player
         player = player_service.create_player_from_fields(owner_id, player_fields.copy())
 
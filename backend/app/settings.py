@@ -51,6 +51,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'app.core.middleware.event_stream_gzip_middleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -211,6 +212,10 @@ RAG_MAX_FILE_SIZE_MB = int(os.getenv('RAG_MAX_FILE_SIZE_MB', '50'))
 RAG_TOP_K = int(os.getenv('RAG_TOP_K', '30'))  # Initial retrieval count
 RAG_TOP_N = int(os.getenv('RAG_TOP_N', '8'))  # Final chunks after reranking
 RAG_MAX_CONTEXT_TOKENS = int(os.getenv('RAG_MAX_CONTEXT_TOKENS', '4000'))  # Max tokens in context
+COMPOSER_MAX_CONTEXT_TOKENS = int(os.getenv('COMPOSER_MAX_CONTEXT_TOKENS', '8000'))  # Max search-result tokens in the report composer prompt
+RAG_QUERY_EMBEDDING_CACHE_SIZE = int(os.getenv('RAG_QUERY_EMBEDDING_CACHE_SIZE', '2000'))  # Cached query embeddings per process (0 disables)
+RAG_QUERY_EMBEDDING_CACHE_TTL_SECONDS = int(os.getenv('RAG_QUERY_EMBEDDING_CACHE_TTL_SECONDS', '600'))
+RAG_EMBEDDING_MAX_CONCURRENCY = int(os.getenv('RAG_EMBEDDING_MAX_CONCURRENCY', '8'))  # In-flight embedding requests per process
 
 # PDF Extraction Configuration
 PDF_EXTRACTOR_PREFERENCE = os.getenv('PDF_EXTRACTOR_PREFERENCE', 'pypdf')  # pypdf, pdfplumber, pymupdf, ocr
@@ -243,3 +248,7 @@ MAX_CONCURRENT_STREAMS_PER_USER = int(os.getenv('MAX_CONCURRENT_STREAMS_PER_USER
 
 # Redis
 REDIS_PUBLISH_CONCURRENCY = int(os.getenv('REDIS_PUBLISH_CONCURRENCY', '100'))
+
+# LLM Response Cache (deterministic temperature=0 calls only)
+LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'True') == 'True'
+LLM_CACHE_TTL_SECONDS = int(os.getenv('LLM_CACHE_TTL_SECONDS', '3600'))
@@ -669,7 +669,7 @@ export default function ChatPage() {
                       steps_status: {
                         ...(updates.plan_progress?.steps_status || {}),
                         [updateData.step_index]: {
-                          status: updateData.status as 'pending' | 'in_progress' | 'completed' | 'error',
+                          status: updateData.status as 'pending' | 'in_progress' | 'completed' | 'error' | 'skipped',
                           step_name: updateData.step_name,
                           result: updateData.result,
                         }
@@ -812,7 +812,7 @@ export default function ChatPage() {
               })
               
               // Persist plan progress to backend (debounced - only update on step completion)
-              if (progressData.status === 'completed' || progressData.status === 'error') {
+              if (progressData.status === 'completed' || progressData.status === 'error' || progressData.status === 'skipped') {
                 // Build progress object from current state
                 const updatedProgress = {
                   current_step_index: progressData.step_index,
@@ -1549,7 +1549,7 @@ export default function ChatPage() {
     // Track the temp ID of any final message we create (for updating with DB ID later)
     let finalMessageTempId: number | null = null
     // Accumulate all completed steps for persistence (backend needs full state, not just current step)
-    const accumulatedStepsStatus: Record<number, { status: 'pending' | 'in_progress' | 'completed' | 'error'; step_name: string; result?: string }> = {}
+    const accumulatedStepsStatus: Record<number, { status: 'pending' | 'in_progress' | 'completed' | 'error' | 'skipped'; step_name: string; result?: string }> = {}
 
     const resumeStream = createResumeStream(
       currentSession.id,
@@ -1601,9 +1601,9 @@ export default function ChatPage() {
           })
 
           // Accumulate step status for persistence
-          if (progressData.status === 'completed' || progressData.status === 'error') {
+          if (progressData.status === 'completed' || progressData.status === 'error' || progressData.status === 'skipped') {
             accumulatedStepsStatus[progressData.step_index] = {
-              status: progressData.status as 'completed' | 'error',
+              status: progressData.status as 'completed' | 'error' | 'skipped',
               step_name: progressData.step_name,
               result: progressData.result,
             }
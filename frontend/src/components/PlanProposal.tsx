@@ -1,6 +1,6 @@
 import React, { useState } from 'react'
 import { Button } from '@/components/ui/button'
-import { ChevronDown, ChevronRight, Check, Loader2, Circle } from 'lucide-react'
+import { ChevronDown, ChevronRight, Check, Loader2, Circle, MinusCircle } from 'lucide-react'
 import { cn } from '@/lib/utils'
 
 export interface PlanStep {
@@ -10,7 +10,7 @@ export interface PlanStep {
   props?: Record<string, any>  // Optional - only present for "tool" actions with arguments
   agent: string
   query: string
-  status?: 'pending' | 'in_progress' | 'completed' | 'error'  // Execution status
+  status?: 'pending' | 'in_progress' | 'completed' | 'error' | 'skipped'  // Execution status
 }
 
 export interface PlanProposalData {
@@ -65,7 +65,7 @@ export default function PlanProposal({
     return agent.charAt(0).toUpperCase() + agent.slice(1)
   }
 
-  const getStepStatus = (step: PlanStep, index: number): 'pending' | 'in_progress' | 'completed' | 'error' => {
+  const getStepStatus = (step: PlanStep, index: number): 'pending' | 'in_progress' | 'completed' | 'error' | 'skipped' => {
     // Use explicit status if provided
     if (step.status) return step.status
     
@@ -76,7 +76,7 @@ export default function PlanProposal({
     return 'pending'
   }
 
-  const getStatusIcon = (status: 'pending' | 'in_progress' | 'completed' | 'error') => {
+  const getStatusIcon = (status: 'pending' | 'in_progress' | 'completed' | 'error' | 'skipped') => {
     switch (status) {
       case 'completed':
         return <Check className="w-4 h-4 text-green-500" />
@@ -84,12 +84,14 @@ export default function PlanProposal({
         return <Loader2 className="w-4 h-4 text-blue-500 animate-spin" />
       case 'error':
         return <Circle className="w-4 h-4 text-destructive fill-destructive" />
+      case 'skipped':
+        return <MinusCircle className="w-4 h-4 text-muted-foreground" />
       default:
         return <Circle className="w-4 h-4 text-muted-foreground" />
     }
   }
 
-  const getStatusBgColor = (status: 'pending' | 'in_progress' | 'completed' | 'error') => {
+  const getStatusBgColor = (status: 'pending' | 'in_progress' | 'completed' | 'error' | 'skipped') => {
     switch (status) {
       case 'completed':
         return 'bg-green-500/10 border-green-500/20'
@@ -97,6 +99,8 @@ export default function PlanProposal({
         return 'bg-blue-500/10 border-blue-500/30'
       case 'error':
         return 'bg-destructive/10 border-destructive/20'
+      case 'skipped':
+        return 'bg-background/50 opacity-60'
       default:
         return 'bg-background/50'
     }
@@ -231,7 +235,8 @@ export default function PlanProposal({
                   <div className="flex items-center gap-2 flex-wrap">
                     <span className={cn(
                       "text-sm",
-                      status === 'completed' ? 'text-muted-foreground' : 'text-foreground'
+                      status === 'completed' ? 'text-muted-foreground' : 'text-foreground',
+                      status === 'skipped' && 'text-muted-foreground line-through'
                     )}>
                       {isExpanded && hasLongDesc ? getStepFullDescription(step) : getStepPreview(step)}
                     </span>
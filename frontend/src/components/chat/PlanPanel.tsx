@@ -7,7 +7,7 @@
  * Location: frontend/src/components/chat/PlanPanel.tsx
  */
 import React from 'react'
-import { X, ChevronLeft, ChevronRight, Check, Loader2, Circle, AlertCircle } from 'lucide-react'
+import { X, ChevronLeft, ChevronRight, Check, Loader2, Circle, AlertCircle, MinusCircle } from 'lucide-react'
 import { Button } from '@/components/ui/button'
 import { cn } from '@/lib/utils'
 
@@ -20,14 +20,14 @@ interface PlanStep {
   agent: string
   query: string
   description?: string
-  status?: 'pending' | 'in_progress' | 'completed' | 'error'
+  status?: 'pending' | 'in_progress' | 'completed' | 'error' | 'skipped'
 }
 
 interface PlanProgress {
   current_step_index: number
   total_steps: number
   steps_status: Record<number, {
-    status: 'pending' | 'in_progress' | 'completed' | 'error'
+    status: 'pending' | 'in_progress' | 'completed' | 'error' | 'skipped'
     step_name: string
     result?: string
   }>
@@ -79,7 +79,12 @@ export default function PlanPanel({
     return null
   }
 
-  const getStepStatus = (step: PlanStep, index: number): 'pending' | 'in_progress' | 'completed' | 'error' => {
+  const getStepStatus = (step: PlanStep, index: number): 'pending' | 'in_progress' | 'completed' | 'error' | 'skipped' => {
+    // Skipped steps (run ended on a HITL rejection) stay skipped after completion
+    if (progress?.steps_status?.[index]?.status === 'skipped') {
+      return 'skipped'
+    }
+
     // If plan is completed, all steps are completed
     if (isCompleted) {
       return 'completed'
@@ -107,7 +112,7 @@ export default function PlanPanel({
     return 'pending'
   }
 
-  const getStatusIcon = (status: 'pending' | 'in_progress' | 'completed' | 'error') => {
+  const getStatusIcon = (status: 'pending' | 'in_progress' | 'completed' | 'error' | 'skipped') => {
     switch (status) {
       case 'completed':
         return <Check className="w-3.5 h-3.5 text-green-500" />
@@ -115,6 +120,8 @@ export default function PlanPanel({
         return <Loader2 className="w-3.5 h-3.5 text-blue-500 animate-spin" />
       case 'error':
         return <AlertCircle className="w-3.5 h-3.5 text-destructive" />
+      case 'skipped':
+        return <MinusCircle className="w-3.5 h-3.5 text-muted-foreground" />
       default:
         return <Circle className="w-3.5 h-3.5 text-muted-foreground" />
     }
@@ -149,6 +156,7 @@ export default function PlanPanel({
                   status === 'completed' && 'bg-green-500',
                   status === 'in_progress' && 'bg-blue-500 animate-pulse',
                   status === 'error' && 'bg-destructive',
+                  status === 'skipped' && 'bg-muted-foreground/60',
                   status === 'pending' && 'bg-muted-foreground/30'
                 )}
                 title={`Step ${index + 1}: ${status}`}
@@ -250,6 +258,7 @@ export default function PlanPanel({
                 status === 'completed' && 'bg-green-500/5 border-green-500/20',
                 status === 'in_progress' && 'bg-blue-500/10 border-blue-500/30',
                 status === 'error' && 'bg-destructive/5 border-destructive/20',
+                status === 'skipped' && 'bg-muted/30 border-transparent opacity-60',
                 status === 'pending' && 'bg-muted/30 border-transparent'
               )}
               title={stepDescription}
@@ -279,7 +288,8 @@ export default function PlanPanel({
                   <div 
                     className={cn(
                       "mt-0.5 line-clamp-2",
-                      status === 'completed' ? 'text-muted-foreground' : 'text-foreground/80'
+                      status === 'completed' ? 'text-muted-foreground' : 'text-foreground/80',
+                      status === 'skipped' && 'text-muted-foreground line-through'
                     )}
                     title={stepDescription}
                   >
@@ -20,7 +20,7 @@ export interface PlanProposalData {
     props?: Record<string, any>
     agent: string
     query: string
-    status?: 'pending' | 'in_progress' | 'completed' | 'error'
+    status?: 'pending' | 'in_progress' | 'completed' | 'error' | 'skipped'
   }>
   plan_index: number
   plan_total: number
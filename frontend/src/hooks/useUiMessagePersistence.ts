@@ -24,7 +24,7 @@ interface PlanData {
     props?: Record<string, any>
     agent: string
     query: string
-    status?: 'pending' | 'in_progress' | 'completed' | 'error'
+    status?: 'pending' | 'in_progress' | 'completed' | 'error' | 'skipped'
   }>
   plan_index: number
   plan_total: number
@@ -36,7 +36,7 @@ interface PlanProgress {
   current_step_index: number
   total_steps: number
   steps_status: Record<number, {
-    status: 'pending' | 'in_progress' | 'completed' | 'error'
+    status: 'pending' | 'in_progress' | 'completed' | 'error' | 'skipped'
     step_name: string
     result?: string
   }>